@@ -1,5 +1,6 @@
 """FastAPI dependencies for the application."""
 
+import re
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -9,6 +10,9 @@ from app.core.config import get_settings, Settings
 # Optional: Add authentication if needed later
 security = HTTPBearer(auto_error=False)
 
+# URL-safe upload IDs (22 chars) as well as legacy dashed UUIDs (36 chars)
+FILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
 
 async def get_current_settings() -> Settings:
     """Get current application settings."""
@@ -17,7 +21,7 @@ async def get_current_settings() -> Settings:
 
 async def verify_file_id(file_id: str) -> str:
     """Verify and validate file ID format."""
-    if not file_id or len(file_id) < 10:
+    if not file_id or not FILE_ID_PATTERN.match(file_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -1,16 +1,15 @@
 """Data processing and conversion API endpoints."""
 
 import uuid
-import asyncio
-from pathlib import Path
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from app.core.config import get_settings, Settings
-from app.core.exceptions import FileProcessingError, ConversionError
+from app.core.exceptions import FileProcessingError
+from app.core.file_index import resolve_file
+from app.core.responses import DefaultJSONResponse
 from app.models.schemas import (
     PreviewRequest,
     ConvertRequest,
@@ -24,15 +23,21 @@ from app.processors.csv_processor import csv_processor
 from app.processors.json_processor import json_processor
 from app.processors.json_generator import json_generator
 from app.utils.logger import get_logger
+from app.workers.convert_worker import (
+    create_job,
+    enqueue_conversion,
+    get_job,
+    watch_job,
+)
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-# In-memory job storage (in production, use Redis or database)
-jobs: Dict[str, Dict[str, Any]] = {}
-
 
-@router.get("/preview/{file_id}")
+@router.get(
+    "/preview/{file_id}",
+    responses={200: {"model": Union[ExcelPreviewResponse, CSVPreviewResponse]}},
+)
 async def preview_file(
     file_id: str,
     max_rows: int = Query(default=100, ge=1, le=1000),
@@ -49,17 +54,9 @@ async def preview_file(
     try:
         logger.info(f"Generating preview for file: {file_id}")
 
-        # Find file
-        file_path = None
-        file_type = None
-        for ext in settings.allowed_extensions_set:
-            potential_path = settings.upload_path / f"{file_id}{ext}"
-            if potential_path.exists():
-                file_path = potential_path
-                file_type = ext.replace(".", "")
-                break
-
-        if not file_path:
+        # Resolve file location
+        resolved = await resolve_file(file_id)
+        if not resolved:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -68,19 +65,19 @@ async def preview_file(
                 },
             )
 
-        # Read file content
-        with open(file_path, "rb") as f:
-            content = f.read()
+        file_path, file_ext = resolved
+        file_type = file_ext.replace(".", "")
 
-        # Process based on file type
+        # Process based on file type; parsing runs in the executor so the
+        # event loop stays responsive, and the file is read there from disk
         if file_type == "xlsx":
-            preview_data = excel_processor.get_preview(
-                content, file_path.name, max_rows
+            preview_data = await excel_processor.get_preview_async(
+                file_path, max_rows
             )
         elif file_type in {"csv", "tsv"}:
-            preview_data = csv_processor.get_preview(content, file_path.name, max_rows)
+            preview_data = await csv_processor.get_preview_async(file_path, max_rows)
         elif file_type == "json":
-            preview_data = json_processor.get_preview(content, file_path.name, max_rows)
+            preview_data = await json_processor.get_preview_async(file_path, max_rows)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -90,7 +87,9 @@ async def preview_file(
                 },
             )
 
-        return preview_data
+        # Serialize directly; the preview models only document the shape, so
+        # skip per-row response validation and jsonable_encoder
+        return DefaultJSONResponse(preview_data)
 
     except HTTPException:
         raise
@@ -112,6 +111,49 @@ async def preview_file(
         )
 
 
+@router.get("/stream/{file_id}")
+async def stream_records(file_id: str):
+    """
+    Stream the processed rows of a CSV/TSV file as JSON lines.
+
+    - **file_id**: Unique file identifier
+
+    Returns one ``{"type": "data", ...}`` line per row, parsed in batches so
+    arbitrarily large files are served in constant memory.
+    """
+    resolved = await resolve_file(file_id)
+    if not resolved:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "File Not Found",
+                "message": f"File with ID '{file_id}' not found",
+            },
+        )
+
+    file_path, file_ext = resolved
+    file_type = file_ext.replace(".", "")
+    if file_type not in {"csv", "tsv"}:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "Unsupported File Type",
+                "message": "Row streaming is only supported for CSV/TSV files",
+            },
+        )
+
+    def record_lines():
+        try:
+            yield from json_generator.iter_data_lines(
+                csv_processor.iter_records(file_path)
+            )
+        except Exception as e:
+            logger.error(f"Record stream failed for {file_id}: {str(e)}")
+            raise
+
+    return StreamingResponse(record_lines(), media_type="application/x-ndjson")
+
+
 @router.post("/convert/{file_id}", response_model=ConvertResponse)
 async def convert_file(
     file_id: str, request: ConvertRequest, settings: Settings = Depends(get_settings)
@@ -140,17 +182,9 @@ async def convert_file(
                 },
             )
 
-        # Find file
-        file_path = None
-        file_type = None
-        for ext in settings.allowed_extensions_set:
-            potential_path = settings.upload_path / f"{file_id}{ext}"
-            if potential_path.exists():
-                file_path = potential_path
-                file_type = ext.replace(".", "")
-                break
-
-        if not file_path:
+        # Resolve file location
+        resolved = await resolve_file(file_id)
+        if not resolved:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -159,21 +193,23 @@ async def convert_file(
                 },
             )
 
+        file_path, file_ext = resolved
+        file_type = file_ext.replace(".", "")
+
         # Create conversion job
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         output_format = getattr(request.output_format, "value", request.output_format)
-        jobs[job_id] = {
-            "job_id": job_id,
-            "file_id": file_id,
-            "output_format": output_format,
-            "status": "pending",
-            "created_at": datetime.now(timezone.utc),
-            "file_path": file_path,
-            "file_type": file_type,
-        }
+        await create_job(
+            job_id,
+            file_id=file_id,
+            output_format=output_format,
+            file_path=file_path,
+            file_type=file_type,
+            pretty_print=int(request.pretty_print),
+        )
 
         # Start conversion in background
-        asyncio.create_task(process_conversion(job_id, request))
+        enqueue_conversion(job_id)
 
         return ConvertResponse(
             job_id=job_id,
@@ -193,6 +229,18 @@ async def convert_file(
         )
 
 
+def _job_status_response(job_id: str, job: Dict[str, Any]) -> JobStatusResponse:
+    """Build the status response model from a stored job."""
+    return JobStatusResponse(
+        job_id=job_id,
+        status=job["status"],
+        message=job.get("message"),
+        error=job.get("error"),
+        created_at=job["created_at"],
+        completed_at=job.get("completed_at"),
+    )
+
+
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
     """
@@ -203,7 +251,8 @@ async def get_job_status(job_id: str):
     Returns current job status and progress.
     """
     try:
-        if job_id not in jobs:
+        job = await get_job(job_id)
+        if not job:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -212,16 +261,7 @@ async def get_job_status(job_id: str):
                 },
             )
 
-        job = jobs[job_id]
-
-        return JobStatusResponse(
-            job_id=job_id,
-            status=job["status"],
-            message=job.get("message"),
-            error=job.get("error"),
-            created_at=job["created_at"],
-            completed_at=job.get("completed_at"),
-        )
+        return _job_status_response(job_id, job)
 
     except HTTPException:
         raise
@@ -236,59 +276,35 @@ async def get_job_status(job_id: str):
         )
 
 
-async def process_conversion(job_id: str, request: ConvertRequest):
-    """Background task to process file conversion."""
-    try:
-        job = jobs[job_id]
-        job["status"] = "processing"
-
-        logger.info(f"Processing conversion job: {job_id}")
+@router.get("/status/{job_id}/stream")
+async def stream_job_status(job_id: str):
+    """
+    Stream conversion job status changes as Server-Sent Events.
 
-        # Read file content
-        with open(job["file_path"], "rb") as f:
-            content = f.read()
+    - **job_id**: Unique job identifier
 
-        # Process file based on type
-        if job["file_type"] == "xlsx":
-            processed_data = excel_processor.process_file(
-                content, job["file_path"].name
-            )
-        elif job["file_type"] in {"csv", "tsv"}:
-            processed_data = csv_processor.process_file(content, job["file_path"].name)
-        elif job["file_type"] == "json":
-            processed_data = json_processor.process_file(content, job["file_path"].name)
-        else:
-            raise ConversionError(f"Unsupported file type: {job['file_type']}")
-
-        # Generate output
-        output_format = job.get("output_format")
-        if hasattr(output_format, "value"):
-            output_format = output_format.value
-            job["output_format"] = output_format
-        if not output_format:
-            output_format = getattr(request.output_format, "value", request.output_format)
-            job["output_format"] = output_format
-        output_content = json_generator.generate_output(
-            processed_data, output_format
+    Sends the current status immediately and an event on every change; the
+    stream ends once the job has completed or failed.
+    """
+    if not await get_job(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "Job Not Found",
+                "message": f"Job with ID '{job_id}' not found",
+            },
         )
 
-        # Save output file
-        output_filename = f"{job['file_id']}_converted.{output_format}"
-        output_path = Path("static/uploads") / output_filename
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(output_content)
-
-        # Update job status
-        job["status"] = "completed"
-        job["completed_at"] = datetime.now(timezone.utc)
-        job["output_file"] = output_filename
-        job["message"] = "Conversion completed successfully"
-
-        logger.info(f"Conversion job completed: {job_id}")
-
-    except Exception as e:
-        logger.error(f"Conversion job failed: {job_id} - {str(e)}")
-        job["status"] = "failed"
-        job["error"] = str(e)
-        job["completed_at"] = datetime.now(timezone.utc)
+    async def event_stream():
+        try:
+            async for job in watch_job(job_id):
+                payload = _job_status_response(job_id, job).model_dump_json()
+                yield f"data: {payload}\n\n"
+        except Exception as e:
+            logger.error(f"Job status stream failed for {job_id}: {str(e)}")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
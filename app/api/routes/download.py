@@ -1,40 +1,254 @@
 """File download API endpoints."""
 
+import asyncio
+import hashlib
+import io
+import os
+import re
+import zipfile
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from fastapi.responses import FileResponse, JSONResponse
+import aiofiles
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 
 from app.core.config import get_settings, Settings
+from app.core.file_index import resolve_converted_file
 from app.models.schemas import DownloadResponse, BatchDownloadRequest
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+RANGE_CHUNK_SIZE = 64 * 1024
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range ``Range`` header.
+
+    Args:
+        range_header: Raw ``Range`` header value
+        file_size: Size of the requested file in bytes
+
+    Returns:
+        Inclusive ``(start, end)`` byte offsets, or None when the header is
+        malformed or asks for multiple ranges (the full file is served then)
+
+    Raises:
+        HTTPException: If the range cannot be satisfied
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start_text, end_text = match.groups()
+    if not start_text and not end_text:
+        return None
+
+    if not start_text:
+        # Suffix range: the last N bytes
+        start = max(file_size - int(end_text), 0)
+        end = file_size - 1
+    else:
+        start = int(start_text)
+        end = min(int(end_text), file_size - 1) if end_text else file_size - 1
+
+    if start >= file_size or start > end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail={
+                "error": "Range Not Satisfiable",
+                "message": (
+                    f"Requested range is outside of the file size ({file_size} bytes)"
+                ),
+            },
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+
+    return start, end
+
+
+def _etag(file_stats: os.stat_result) -> str:
+    """Build a strong ETag from a file's inode, modification time and size."""
+    digest = hashlib.blake2b(
+        f"{file_stats.st_ino}-{file_stats.st_mtime_ns}-{file_stats.st_size}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an ``If-None-Match`` header against an ETag."""
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _if_range_matches(if_range: str, etag: str, file_stats: os.stat_result) -> bool:
+    """
+    Check an ``If-Range`` header against the current version of a file.
+
+    Args:
+        if_range: Raw ``If-Range`` header value (an entity tag or HTTP date)
+        etag: Current strong ETag of the file
+        file_stats: Current stat result of the file
+
+    Returns:
+        True if the range may be served; otherwise the full file is sent
+    """
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        # Weak tags never match, the comparison is strong
+        return if_range == etag
+
+    try:
+        last_modified = parsedate_to_datetime(if_range)
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified.timestamp()) == int(file_stats.st_mtime)
+
+
+async def _iter_file_range(path: Path, start: int, end: int):
+    """Yield the inclusive byte range ``start..end`` of a file in fixed-size chunks."""
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class _ZipBuffer(io.RawIOBase):
+    """Unseekable sink collecting the bytes ``zipfile`` writes between drains."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip(paths: Iterable[Path]) -> Iterator[bytes]:
+    """
+    Stream a zip archive of the given files without buffering it in memory.
+
+    Entries are stored uncompressed; because the sink is unseekable, ``zipfile``
+    writes sizes and CRCs in data descriptors after each entry.
+
+    Args:
+        paths: Files to add to the archive
+
+    Yields:
+        Consecutive chunks of the archive
+    """
+    sink = _ZipBuffer()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for path in paths:
+            info = zipfile.ZipInfo.from_file(path, arcname=path.name)
+            info.compress_type = zipfile.ZIP_STORED
+            force_zip64 = info.file_size >= zipfile.ZIP64_LIMIT
+            with open(path, "rb") as src, archive.open(
+                info, mode="w", force_zip64=force_zip64
+            ) as dest:
+                while chunk := src.read(RANGE_CHUNK_SIZE):
+                    dest.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()
+
+
+@router.post("/batch")
+async def batch_download(
+    request: BatchDownloadRequest, settings: Settings = Depends(get_settings)
+):
+    """
+    Download several converted files as a single zip archive.
+
+    - **file_ids**: Unique file identifiers (1-10)
+    - **output_format**: Output format the files were converted to
+
+    Returns a zip archive streamed as it is built.
+    """
+    try:
+        file_ids = list(dict.fromkeys(request.file_ids))
+        output_format = request.output_format.value
+        paths = await asyncio.gather(
+            *(resolve_converted_file(file_id, output_format) for file_id in file_ids)
+        )
+
+        missing = [file_id for file_id, path in zip(file_ids, paths) if path is None]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": "File Not Found",
+                    "message": (
+                        f"Converted {output_format} files not found: "
+                        f"{', '.join(missing)}"
+                    ),
+                },
+            )
+
+        logger.info(f"Batch download request for {len(file_ids)} files")
+
+        return StreamingResponse(
+            _iter_zip(paths),
+            media_type="application/zip",
+            headers={
+                "Content-Disposition": 'attachment; filename="converted_files.zip"'
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch download failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": "Server Error", "message": "Failed to download files"},
+        )
+
 
 @router.get("/{file_id}")
 async def download_converted_file(
-    file_id: str, settings: Settings = Depends(get_settings)
+    file_id: str, request: Request, settings: Settings = Depends(get_settings)
 ):
     """
     Download converted file.
 
     - **file_id**: Unique file identifier
 
-    Returns the converted file for download.
+    Returns the converted file for download. A single ``Range: bytes=start-end``
+    header is honoured with a ``206 Partial Content`` response so clients can
+    resume interrupted downloads (unless an ``If-Range`` validator no longer
+    matches the file), and a matching ``If-None-Match`` yields
+    ``304 Not Modified``.
     """
     try:
         logger.info(f"Download request for file: {file_id}")
 
-        # Look for converted files
-        download_path = None
-        for format_ext in ["json", "jsonl", "csv"]:
-            potential_path = settings.upload_path / f"{file_id}_converted.{format_ext}"
-            if potential_path.exists():
-                download_path = potential_path
-                break
+        # Resolve converted file location
+        download_path = await resolve_converted_file(file_id)
 
         if not download_path:
             raise HTTPException(
@@ -53,8 +267,48 @@ async def download_converted_file(
         else:
             content_type = "text/csv"
 
-        return FileResponse(
-            path=download_path, filename=download_path.name, media_type=content_type
+        file_stats = download_path.stat()
+        etag = _etag(file_stats)
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+        # A stale If-Range means the client holds another version of the file,
+        # so the full file is sent instead of a range
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        if range_header and if_range and not _if_range_matches(
+            if_range, etag, file_stats
+        ):
+            range_header = None
+        byte_range = (
+            _parse_range(range_header, file_stats.st_size) if range_header else None
+        )
+
+        if byte_range is None:
+            return FileResponse(
+                path=download_path,
+                filename=download_path.name,
+                media_type=content_type,
+                stat_result=file_stats,
+                headers={"Accept-Ranges": "bytes", "ETag": etag},
+            )
+
+        start, end = byte_range
+        return StreamingResponse(
+            _iter_file_range(download_path, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=content_type,
+            headers={
+                "Accept-Ranges": "bytes",
+                "ETag": etag,
+                "Content-Range": f"bytes {start}-{end}/{file_stats.st_size}",
+                "Content-Length": str(end - start + 1),
+                "Content-Disposition": f'attachment; filename="{download_path.name}"',
+            },
         )
 
     except HTTPException:
@@ -77,13 +331,8 @@ async def get_download_info(file_id: str, settings: Settings = Depends(get_setti
     Returns file information and download URL.
     """
     try:
-        # Look for converted files
-        download_path = None
-        for format_ext in ["json", "jsonl", "csv"]:
-            potential_path = settings.upload_path / f"{file_id}_converted.{format_ext}"
-            if potential_path.exists():
-                download_path = potential_path
-                break
+        # Resolve converted file location
+        download_path = await resolve_converted_file(file_id)
 
         if not download_path:
             raise HTTPException(
@@ -109,6 +358,7 @@ async def get_download_info(file_id: str, settings: Settings = Depends(get_setti
             "size": file_stats.st_size,
             "download_url": f"/api/v1/download/{file_id}",
             "created_at": file_stats.st_ctime,
+            "etag": _etag(file_stats),
         }
 
     except HTTPException:
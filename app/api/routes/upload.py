@@ -1,6 +1,6 @@
 """File upload API endpoints."""
 
-import uuid
+import secrets
 import aiofiles
 from pathlib import Path
 from datetime import datetime, timezone
@@ -10,6 +10,7 @@ from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, status
 from fastapi.responses import JSONResponse
 
 from app.core.config import get_settings, Settings
+from app.core.file_index import forget_file, register_file, resolve_file
 from app.core.exceptions import (
     FileValidationError,
     file_too_large_exception,
@@ -22,6 +23,8 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+UTC = timezone.utc
+
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload_file(
@@ -41,7 +44,7 @@ async def upload_file(
         await validate_uploaded_file(file)
 
         # Generate unique file ID
-        file_id = str(uuid.uuid4())
+        file_id = secrets.token_urlsafe(16)
 
         # Get file extension
         file_ext = Path(file.filename).suffix.lower()
@@ -49,13 +52,22 @@ async def upload_file(
         # Create upload path
         upload_path = settings.upload_path / f"{file_id}{file_ext}"
 
-        # Save file
-        async with aiofiles.open(upload_path, "wb") as f:
-            content = await file.read()
-            await f.write(content)
+        # Stream file to disk in fixed-size chunks
+        max_size = settings.MAX_FILE_SIZE
+        file_size = 0
+        async with aiofiles.open(upload_path, "wb") as out:
+            while chunk := await file.read(settings.CHUNK_BYTES):
+                file_size += len(chunk)
+                if max_size and file_size > max_size:
+                    break
+                await out.write(chunk)
+
+        if max_size and file_size > max_size:
+            upload_path.unlink(missing_ok=True)
+            logger.error(f"File upload exceeded size limit: {file.filename}")
+            raise file_too_large_exception(max_size)
 
-        # Get file size
-        file_size = len(content)
+        await register_file(file_id, upload_path)
 
         logger.info(f"File saved: {upload_path} (Size: {file_size} bytes)")
 
@@ -64,9 +76,11 @@ async def upload_file(
             filename=file.filename,
             file_type=file_ext.replace(".", ""),
             size=file_size,
-            uploaded_at=datetime.now(timezone.utc),
+            uploaded_at=datetime.now(UTC),
         )
 
+    except HTTPException:
+        raise
     except FileValidationError as e:
         logger.error(f"File validation failed: {e.message}")
         raise HTTPException(
@@ -95,15 +109,9 @@ async def get_file_info(file_id: str, settings: Settings = Depends(get_settings)
     Returns file metadata and status.
     """
     try:
-        # Find file with any supported extension
-        file_path = None
-        for ext in settings.allowed_extensions_set:
-            potential_path = settings.upload_path / f"{file_id}{ext}"
-            if potential_path.exists():
-                file_path = potential_path
-                break
-
-        if not file_path:
+        # Resolve file location
+        resolved = await resolve_file(file_id)
+        if not resolved:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -112,6 +120,8 @@ async def get_file_info(file_id: str, settings: Settings = Depends(get_settings)
                 },
             )
 
+        file_path, _ = resolved
+
         # Get file stats
         file_stats = file_path.stat()
 
@@ -121,10 +131,10 @@ async def get_file_info(file_id: str, settings: Settings = Depends(get_settings)
             "file_type": file_path.suffix.replace(".", ""),
             "size": file_stats.st_size,
             "created_at": datetime.fromtimestamp(
-                file_stats.st_ctime, timezone.utc
+                file_stats.st_ctime, UTC
             ).isoformat(),
             "modified_at": datetime.fromtimestamp(
-                file_stats.st_mtime, timezone.utc
+                file_stats.st_mtime, UTC
             ).isoformat(),
         }
 
@@ -151,17 +161,9 @@ async def delete_file(file_id: str, settings: Settings = Depends(get_settings)):
     Returns confirmation of deletion.
     """
     try:
-        # Find and delete file with any supported extension
-        deleted = False
-        for ext in settings.allowed_extensions_set:
-            file_path = settings.upload_path / f"{file_id}{ext}"
-            if file_path.exists():
-                file_path.unlink()
-                deleted = True
-                logger.info(f"Deleted file: {file_path}")
-                break
-
-        if not deleted:
+        # Find and delete the uploaded file
+        resolved = await resolve_file(file_id)
+        if not resolved:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -170,6 +172,11 @@ async def delete_file(file_id: str, settings: Settings = Depends(get_settings)):
                 },
             )
 
+        file_path, _ = resolved
+        file_path.unlink(missing_ok=True)
+        await forget_file(file_id)
+        logger.info(f"Deleted file: {file_path}")
+
         return {"message": "File deleted successfully", "file_id": file_id}
 
     except HTTPException:
@@ -2,11 +2,15 @@
 
 Notes:
  - List/Set like values provided through environment variables are stored as comma
-     separated strings and exposed through convenience properties that parse them.
+     separated strings and exposed through convenience properties that parse them
+     once and cache the result on the (singleton) settings instance. Values that
+     are only looked up (extensions, output formats) are exposed as immutable
+     frozensets/tuples so callers cannot mutate the shared cached value.
  - The upload folder is ensured to exist via a field validator (mode="before").
 """
 
-from typing import List, Set, Optional
+from functools import cached_property
+from typing import FrozenSet, List, Optional, Tuple
 from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from pathlib import Path
@@ -29,6 +33,7 @@ class Settings(BaseSettings):
     PORT: int = 8000
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
+    WORKERS: Optional[int] = None  # Defaults to 2 * CPUs + 1 with a shared job store
 
     # File Upload Settings
     MAX_FILE_SIZE: Optional[int] = None  # Unlimited by default
@@ -36,6 +41,10 @@ class Settings(BaseSettings):
     ALLOWED_EXTENSIONS: str = ".xlsx,.csv,.tsv,.json"
     OUTPUT_FORMATS: str = "json,jsonl,csv"
     TEMP_FILE_RETENTION: int = 3600  # 1 hour
+    DEEP_FILE_VALIDATION: bool = False  # Parse uploads instead of sniffing them
+    VALIDATION_CACHE_SIZE: int = 256  # Deep validation results kept (0 disables)
+    DEEP_VALIDATION_MAX_SIZE: int = 0  # Larger uploads are only sniffed (0: no limit)
+    SERVE_STATIC: Optional[bool] = None  # Defaults to True outside production
 
     # CORS Settings
     CORS_ORIGINS: str = (
@@ -45,7 +54,13 @@ class Settings(BaseSettings):
     # Processing Settings
     MAX_ROWS_PREVIEW: int = 100
     CHUNK_SIZE: int = 1000
+    CHUNK_BYTES: int = 1 << 20  # 1 MiB read size for streamed uploads
     PARALLEL_PROCESSING: bool = True
+    CONVERT_WORKERS: Optional[int] = None  # Defaults to the CPU count
+    RESULT_CACHE_SIZE: int = 32  # Previews kept in memory (0 disables the cache)
+
+    # Job Store (in-memory when unset)
+    REDIS_URL: Optional[str] = None
 
     # Logging Configuration
     LOG_LEVEL: str = "INFO"
@@ -54,19 +69,26 @@ class Settings(BaseSettings):
     # Security
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-    @property
-    def allowed_extensions_set(self) -> Set[str]:
-        """Get allowed extensions as a set."""
-        return {
+    @cached_property
+    def allowed_extensions_set(self) -> FrozenSet[str]:
+        """Get allowed extensions as an immutable set."""
+        return frozenset(
             ext.strip() for ext in self.ALLOWED_EXTENSIONS.split(",") if ext.strip()
-        }
+        )
 
-    @property
-    def output_formats_list(self) -> List[str]:
-        """Get output formats as a list."""
-        return [fmt.strip() for fmt in self.OUTPUT_FORMATS.split(",") if fmt.strip()]
+    @cached_property
+    def output_formats_list(self) -> Tuple[str, ...]:
+        """Get output formats as an immutable sequence."""
+        return tuple(
+            fmt.strip() for fmt in self.OUTPUT_FORMATS.split(",") if fmt.strip()
+        )
 
-    @property
+    @cached_property
+    def output_formats_set(self) -> FrozenSet[str]:
+        """Get lower-cased output formats for membership checks."""
+        return frozenset(fmt.lower() for fmt in self.output_formats_list)
+
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Get CORS origins as a list."""
         return [
@@ -81,7 +103,7 @@ class Settings(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return str(path)
 
-    @property
+    @cached_property
     def upload_path(self) -> Path:
         """Get upload folder as Path object."""
         return Path(self.UPLOAD_FOLDER)
@@ -96,6 +118,13 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.ENVIRONMENT.lower() == "production"
 
+    @property
+    def serve_static(self) -> bool:
+        """Check if the app serves /static itself instead of a reverse proxy."""
+        if self.SERVE_STATIC is None:
+            return not self.is_production
+        return self.SERVE_STATIC
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
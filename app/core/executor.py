@@ -0,0 +1,45 @@
+"""Executor for CPU-bound parsing and serialisation work.
+
+Conversions run in a process pool so pandas/openpyxl work neither blocks the
+event loop nor contends for the GIL with request handling. With
+``PARALLEL_PROCESSING`` disabled the default thread pool is used instead.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.core.config import get_settings
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=get_settings().CONVERT_WORKERS)
+    return _pool
+
+
+async def run_in_process(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a picklable callable off the event loop.
+
+    Args:
+        func: Module-level function to call
+        *args: Picklable positional arguments
+
+    Returns:
+        The function's return value
+    """
+    executor = get_process_pool() if get_settings().PARALLEL_PROCESSING else None
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool if it was created."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,140 @@
+"""Index of uploaded and converted files keyed by file ID.
+
+Uploads and conversion outputs are recorded in ``bkv:file:{file_id}`` hashes in
+the shared store so handlers resolve a file ID with a single lookup instead of
+probing the upload folder once per allowed extension. Each output format keeps
+its own ``converted_path:{format}`` field, since a file may be converted to
+several formats. Files written before the index existed (or before a restart
+with the in-memory store) are found on disk once and then cached. Fields whose
+file is gone are dropped on lookup.
+"""
+
+import os
+from pathlib import Path
+from typing import Collection, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.store import get_store
+
+# Output formats in the order a download without a format prefers them
+CONVERTED_FORMATS = ("json", "jsonl", "csv")
+
+
+def file_key(file_id: str) -> str:
+    """Get the store key holding a file's index entry."""
+    return f"bkv:file:{file_id}"
+
+
+def converted_field(output_format: str) -> str:
+    """Get the index field holding a file's conversion output of a format."""
+    return f"converted_path:{output_format}"
+
+
+def find_file(
+    file_id: str, upload_dir: Path, suffixes: Collection[str]
+) -> Optional[Path]:
+    """
+    Find a file named ``{file_id}{suffix}`` with a single directory scan.
+
+    Args:
+        file_id: Unique file identifier
+        upload_dir: Directory to scan
+        suffixes: Accepted name suffixes following the file ID
+
+    Returns:
+        Path of the first matching file or None
+    """
+    try:
+        with os.scandir(upload_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(file_id) and name[len(file_id) :] in suffixes:
+                    return Path(entry.path)
+    except FileNotFoundError:
+        pass
+    return None
+
+
+async def register_file(file_id: str, path: Path) -> None:
+    """Record the location of an uploaded file."""
+    await get_store().hset(
+        file_key(file_id), mapping={"path": str(path), "ext": path.suffix.lower()}
+    )
+
+
+async def register_converted_file(file_id: str, path: Path) -> None:
+    """Record the location of a file's conversion output (format from suffix)."""
+    await get_store().hset(
+        file_key(file_id),
+        mapping={converted_field(path.suffix.lstrip(".")): str(path)},
+    )
+
+
+async def resolve_file(file_id: str) -> Optional[Tuple[Path, str]]:
+    """
+    Resolve an uploaded file ID.
+
+    Args:
+        file_id: Unique file identifier
+
+    Returns:
+        Tuple of (path, extension) or None if the file does not exist
+    """
+    entry = await get_store().hgetall(file_key(file_id))
+    if entry.get("path"):
+        path = Path(entry["path"])
+        if path.is_file():
+            return path, entry["ext"]
+        # Removed out of band; drop the stale fields and scan again
+        await get_store().hdel(file_key(file_id), "path", "ext")
+
+    settings = get_settings()
+    file_path = find_file(
+        file_id, settings.upload_path, settings.allowed_extensions_set
+    )
+    if file_path is None:
+        return None
+
+    await register_file(file_id, file_path)
+    return file_path, file_path.suffix.lower()
+
+
+async def resolve_converted_file(
+    file_id: str, output_format: Optional[str] = None
+) -> Optional[Path]:
+    """
+    Resolve the conversion output of a file ID.
+
+    Args:
+        file_id: Unique file identifier
+        output_format: Output format to resolve; without one the first
+            existing output in ``CONVERTED_FORMATS`` order is returned
+
+    Returns:
+        Path of the converted file or None if it does not exist
+    """
+    key = file_key(file_id)
+    entry = await get_store().hgetall(key)
+    upload_dir = get_settings().upload_path
+
+    for fmt in (output_format,) if output_format else CONVERTED_FORMATS:
+        field = converted_field(fmt)
+        if entry.get(field):
+            path = Path(entry[field])
+            if path.is_file():
+                return path
+            # Removed out of band; drop only the stale field
+            await get_store().hdel(key, field)
+
+        # Outputs have fixed names, so an unindexed one costs a single stat
+        path = upload_dir / f"{file_id}_converted.{fmt}"
+        if path.is_file():
+            await register_converted_file(file_id, path)
+            return path
+
+    return None
+
+
+async def forget_file(file_id: str) -> None:
+    """Drop a file's index entry."""
+    await get_store().delete(file_key(file_id))
@@ -0,0 +1,41 @@
+"""Custom ASGI middleware."""
+
+from typing import Iterable
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves selected paths uncompressed.
+
+    Downloads need their Content-Length/Range semantics intact, Server-Sent
+    Events must reach the client unbuffered and tiny health checks are not
+    worth compressing.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: Iterable[str] = (),
+        exclude_prefixes: Iterable[str] = (),
+        exclude_suffixes: Iterable[str] = (),
+        **kwargs,
+    ) -> None:
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+        self.exclude_suffixes = tuple(exclude_suffixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if (
+                path in self.exclude_paths
+                or path.startswith(self.exclude_prefixes)
+                or path.endswith(self.exclude_suffixes)
+            ):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,41 @@
+"""JSON response classes used across the application.
+
+orjson is an optional dependency: when it is installed every JSON response is
+encoded with it (including NumPy scalars/arrays and naive datetimes, which are
+treated as UTC); otherwise the stdlib-based ``JSONResponse`` is used. Content
+orjson cannot encode (integers outside the 64-bit range) is also rendered by
+``JSONResponse``.
+"""
+
+from typing import Any, Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    # Probe optional orjson dependency for faster response encoding
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_ORJSON = False
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSON response accepting NumPy values and naive datetimes."""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NAIVE_UTC,
+            )
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits; the stdlib encoder handles them
+            return JSONResponse.render(self, content)
+
+
+DefaultJSONResponse: Type[JSONResponse] = (
+    NumpyORJSONResponse if HAVE_ORJSON else JSONResponse
+)
@@ -0,0 +1,156 @@
+"""Shared state store for conversion jobs and file lookups.
+
+Job state lives in Redis hashes when ``REDIS_URL`` is configured and the
+optional ``redis`` package is installed, so it survives restarts and is shared
+between uvicorn workers. Otherwise an in-process dictionary with the same small
+async hash API is used, which keeps single-process development setups free of
+external services.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from app.core.config import get_settings
+
+try:
+    # Probe optional redis dependency so we can fall back to in-memory state
+    import redis.asyncio as aioredis  # type: ignore
+
+    HAVE_REDIS = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryStore:
+    """Process-local hash store mirroring the subset of Redis we rely on."""
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._expiry: Dict[str, asyncio.TimerHandle] = {}
+
+    async def hset(self, key: str, mapping: Mapping[str, Any]) -> None:
+        """Set fields on the hash stored at key."""
+        self._data.setdefault(key, {}).update(mapping)
+
+    async def hgetall(self, key: str) -> Dict[str, Any]:
+        """Return all fields of the hash stored at key (empty if missing)."""
+        return dict(self._data.get(key, {}))
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        """Remove fields from the hash stored at key."""
+        data = self._data.get(key)
+        if data is None:
+            return
+        for field in fields:
+            data.pop(field, None)
+        if not data:
+            self._discard(key)
+
+    async def delete(self, key: str) -> None:
+        """Remove the hash stored at key."""
+        self._discard(key)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        """Remove the hash stored at key after the given number of seconds."""
+        if key not in self._data:
+            return
+        handle = self._expiry.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        self._expiry[key] = asyncio.get_running_loop().call_later(
+            seconds, self._discard, key
+        )
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        for handle in self._expiry.values():
+            handle.cancel()
+        self._expiry.clear()
+        self._data.clear()
+
+    def _discard(self, key: str) -> None:
+        """Drop a key and any pending expiry timer."""
+        self._data.pop(key, None)
+        handle = self._expiry.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+
+class RedisStore:
+    """Redis-backed hash store."""
+
+    def __init__(self, url: str):
+        self._client = aioredis.from_url(url, decode_responses=True)
+
+    async def hset(self, key: str, mapping: Mapping[str, Any]) -> None:
+        """Set fields on the hash stored at key, skipping empty values."""
+        values = {
+            field: self._encode(value)
+            for field, value in mapping.items()
+            if value is not None
+        }
+        if values:
+            await self._client.hset(key, mapping=values)
+
+    async def hgetall(self, key: str) -> Dict[str, Any]:
+        """Return all fields of the hash stored at key (empty if missing)."""
+        return await self._client.hgetall(key)
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        """Remove fields from the hash stored at key."""
+        await self._client.hdel(key, *fields)
+
+    async def delete(self, key: str) -> None:
+        """Remove the hash stored at key."""
+        await self._client.delete(key)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        """Remove the hash stored at key after the given number of seconds."""
+        await self._client.expire(key, seconds)
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        await self._client.close()
+
+    @staticmethod
+    def _encode(value: Any) -> Any:
+        """Convert values to types Redis can store."""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, Path):
+            return str(value)
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+
+_store: Optional[Any] = None
+
+
+def get_store():
+    """Get the shared state store, creating it on first use."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        if settings.REDIS_URL and HAVE_REDIS:
+            _store = RedisStore(settings.REDIS_URL)
+        else:
+            if settings.REDIS_URL:
+                logger.warning(
+                    "REDIS_URL configured but redis package not installed. Using in-memory store."
+                )
+            _store = InMemoryStore()
+    return _store
+
+
+async def close_store() -> None:
+    """Close the shared state store if it was created."""
+    global _store
+    if _store is not None:
+        await _store.close()
+        _store = None
@@ -1,22 +1,46 @@
 """Main FastAPI application entry point."""
 
 import logging
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse
 from fastapi.exceptions import RequestValidationError
+import jinja2
 import uvicorn
 from pathlib import Path
 
 from app.core.config import get_settings
 from app.core.exceptions import BKVMatrixException
+from app.core.executor import shutdown_process_pool
+from app.core.middleware import SelectiveGZipMiddleware
+from app.core.responses import DefaultJSONResponse
+from app.core.store import close_store
 from app.api.routes import upload, convert, download
 from app.utils.logger import setup_logging
 
+try:
+    # Probe optional uvloop; installed at import so external launchers
+    # (uvicorn app.main:app, gunicorn workers) get the faster event loop too
+    import uvloop  # type: ignore
+
+    uvloop.install()
+    HAVE_UVLOOP = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_UVLOOP = False
+
+try:
+    # Probe optional httptools for uvicorn's C HTTP parser
+    import httptools  # type: ignore  # noqa: F401
+
+    HAVE_HTTPTOOLS = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_HTTPTOOLS = False
+
 
 # Initialize settings
 settings = get_settings()
@@ -43,6 +67,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down BKV Matrix Normalizer application")
+    await close_store()
+    shutdown_process_pool()
 
 
 # Create FastAPI application
@@ -53,6 +79,18 @@ app = FastAPI(
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
+)
+
+# Compression for JSON payloads; downloads, status streams and health checks
+# are sent as-is
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_paths=["/health"],
+    exclude_prefixes=[f"{settings.API_V1_STR}/download"],
+    exclude_suffixes=["/stream"],
 )
 
 # CORS Middleware
@@ -70,15 +108,32 @@ if settings.is_production:
         TrustedHostMiddleware, allowed_hosts=["localhost", "127.0.0.1", settings.HOST]
     )
 
-# Static files
+# Static files; in production a reverse proxy serves /static directly
 static_path = Path("static")
-if static_path.exists():
+serve_static = settings.serve_static and static_path.exists()
+if serve_static:
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
+
+@jinja2.pass_context
+def proxied_url_for(context: dict, name: str, **path_params) -> str:
+    """``url_for`` for templates when /static is not mounted in the app."""
+    if name == "static":
+        return f"/static/{path_params['path']}"
+    return str(context["request"].url_for(name, **path_params))
+
+
 # Templates
 templates_path = Path("templates")
 if templates_path.exists():
     templates = Jinja2Templates(directory="templates")
+    # Only re-check template files for changes while developing
+    templates.env.auto_reload = settings.is_development
+    templates.env.bytecode_cache = jinja2.FileSystemBytecodeCache()
+    if not serve_static:
+        templates.env.globals["url_for"] = proxied_url_for
+    # Compile the landing page at startup instead of on the first request
+    upload_template = templates.get_template("upload.html")
 
 
 # Exception handlers
@@ -86,7 +141,7 @@ if templates_path.exists():
 async def bkv_exception_handler(request: Request, exc: BKVMatrixException):
     """Handle custom BKV Matrix exceptions."""
     logger.error(f"BKV Matrix Exception: {exc.message}", extra={"details": exc.details})
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Processing Error",
@@ -100,7 +155,7 @@ async def bkv_exception_handler(request: Request, exc: BKVMatrixException):
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
     logger.error(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "Validation Error",
@@ -114,7 +169,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "Internal Server Error",
@@ -140,8 +195,15 @@ async def health_check():
 async def root(request: Request):
     """Root endpoint - serves upload page if templates exist, otherwise JSON response."""
     if templates_path.exists():
-        return templates.TemplateResponse(
-            "upload.html", {"request": request, "title": settings.PROJECT_NAME, "settings": settings}
+        if settings.is_development:
+            # Pick up template edits without restarting
+            template = templates.get_template("upload.html")
+        else:
+            template = upload_template
+        return HTMLResponse(
+            template.render(
+                request=request, title=settings.PROJECT_NAME, settings=settings
+            )
         )
     else:
         return {
@@ -166,10 +228,18 @@ app.include_router(
 
 # Run application
 if __name__ == "__main__":
+    # Job state is only shared between worker processes through Redis, so the
+    # in-memory store keeps a single worker
+    workers = settings.WORKERS or (
+        (os.cpu_count() or 1) * 2 + 1 if settings.REDIS_URL else 1
+    )
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="uvloop" if HAVE_UVLOOP else "auto",
+        http="httptools" if HAVE_HTTPTOOLS else "auto",
+        workers=workers,
         reload=settings.is_development,
         log_level=settings.LOG_LEVEL.lower(),
     )
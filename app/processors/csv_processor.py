@@ -1,32 +1,117 @@
 """Delimited text file processor for converting CSV/TSV files to structured data."""
 
+import numpy as np
 import pandas as pd
 import csv
-from typing import Dict, List, Any, Optional, Union
+import re
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 from io import StringIO, BytesIO
 import logging
 from datetime import datetime, timezone
-import chardet
-
 from app.core.config import get_settings
 from app.core.exceptions import FileProcessingError
+from app.core.executor import run_in_process
+from app.utils.cache import cached_file_result
+from app.utils.encoding import detect_encoding
+from app.utils.file_io import mapped_file
+
+try:
+    # Probe optional pyarrow dependency for the multithreaded CSV reader
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+
+    HAVE_PYARROW = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_PYARROW = False
 
 logger = logging.getLogger(__name__)
 
+_SETTINGS = get_settings()
+_MAX_ROWS_PREVIEW = _SETTINGS.MAX_ROWS_PREVIEW
+
+# Bytes read from the head of a file to detect its encoding and delimiter
+SNIFF_SAMPLE_SIZE = 64 * 1024
+
+# Bytes of the head parsed for a preview (grown when too few rows fit)
+PREVIEW_SAMPLE_SIZE = 256 * 1024
+
+# Bytes scanned per step when counting lines
+COUNT_BLOCK_SIZE = 1 << 20
+
+# Characters replaced in column names, and runs of separators squashed after
+COLUMN_NAME_INVALID = re.compile(r"[^\w\- ]")
+COLUMN_NAME_SEPARATORS = re.compile(r"[\s_]+")
+
+# Cell values read as missing
+NA_VALUES = ["", "NA", "N/A", "null", "NULL", "None"]
+
+# Numerals converted to numbers: integers without a decimal point, and
+# decimals (optionally with an exponent) which are parsed as floats
+INTEGER_PATTERN = r"[+-]?\d+(?:_\d+)*"
+DECIMAL_PATTERN = r"[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?"
+INTEGER_RE = re.compile(INTEGER_PATTERN)
+# Numerals the pandas C parser reads into float columns (no nan/inf literals)
+FLOAT_PATTERN = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+DECIMAL_RE = re.compile(DECIMAL_PATTERN)
+BOOLEAN_VALUES = {"true": True, "yes": True, "false": False, "no": False}
+
+
+def _float_cell_value(value: float) -> Any:
+    """Convert a float cell: NaN to None, integral values to int."""
+    if value != value:
+        return None
+    return int(value) if value.is_integer() else value
+
+
+def _text_cell_value(value: str) -> Any:
+    """Convert a text cell: blanks to None, numerals to numbers, yes/no to bool."""
+    cleaned = value.strip()
+
+    # Return None for empty strings
+    if not cleaned:
+        return None
+
+    # Convert numerals to numbers
+    if INTEGER_RE.fullmatch(cleaned):
+        return int(cleaned)
+    if DECIMAL_RE.fullmatch(cleaned):
+        float_val = float(cleaned)
+        return int(float_val) if float_val.is_integer() else float_val
+
+    # Convert to boolean
+    boolean = BOOLEAN_VALUES.get(cleaned.lower())
+    if boolean is not None:
+        return boolean
+
+    return cleaned
+
+
+# Cell conversions keyed by exact type, checked before the generic path
+CELL_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    str: _text_cell_value,
+    float: _float_cell_value,
+    np.float64: _float_cell_value,
+    int: lambda value: value,
+    bool: lambda value: value,
+    np.int64: int,
+    np.bool_: bool,
+    type(None): lambda value: None,
+    datetime: lambda value: value.isoformat(),
+    pd.Timestamp: lambda value: value.isoformat(),
+}
+
 
 class CSVProcessor:
     """Processes delimited text files (CSV/TSV) and converts them to structured data."""
 
-    def __init__(self):
-        self.settings = get_settings()
-
     def process_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
         """
         Process delimited text file and extract structured data.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content (bytes or a read-only mmap)
             filename: Original filename
 
         Returns:
@@ -43,35 +128,37 @@ class CSVProcessor:
             encoding = self._detect_encoding(file_content)
             logger.info(f"Detected encoding: {encoding}")
 
-            # Decode content with fallback
-            try:
-                text_content = file_content.decode(encoding)
-            except (LookupError, UnicodeDecodeError):
-                text_content = file_content.decode("utf-8", errors="ignore")
-
-            # Detect delimiter
-            delimiter = self._detect_delimiter(text_content)
+            # Detect delimiter from the head of the file
+            delimiter = self._detect_delimiter(
+                str(file_content[:SNIFF_SAMPLE_SIZE], encoding, "ignore")
+            )
             logger.info(f"Detected delimiter: '{delimiter}'")
 
-            # Read text with pandas
-            df = pd.read_csv(
-                StringIO(text_content),
-                delimiter=delimiter,
-                keep_default_na=False,
-                na_values=["", "NA", "N/A", "null", "NULL", "None"],
+            # Parse the raw bytes with Arrow, falling back to pandas
+            df = (
+                self._read_with_arrow(file_content, encoding, delimiter)
+                if HAVE_PYARROW
+                else None
             )
+            if df is None:
+                # Decode content with fallback
+                try:
+                    text_content = str(file_content, encoding)
+                except (LookupError, UnicodeDecodeError):
+                    text_content = str(file_content, "utf-8", "ignore")
+
+                df = pd.read_csv(
+                    StringIO(text_content),
+                    delimiter=delimiter,
+                    keep_default_na=False,
+                    na_values=NA_VALUES,
+                )
 
             # Clean column names
             df.columns = [self._clean_column_name(col) for col in df.columns]
 
             # Process data
-            processed_data = []
-            for _, row in df.iterrows():
-                row_data = {}
-                for col in df.columns:
-                    value = row[col]
-                    row_data[col] = self._process_cell_value(value)
-                processed_data.append(row_data)
+            processed_data = self.frame_to_records(df)
 
             # Return structured result
             return {
@@ -90,33 +177,289 @@ class CSVProcessor:
             logger.error(f"Failed to process delimited file {filename}: {str(e)}")
             raise FileProcessingError(f"Delimited text processing failed: {str(e)}")
 
+    def _read_with_arrow(
+        self, file_content: bytes, encoding: str, delimiter: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        Parse delimited bytes with pyarrow's multithreaded CSV reader.
+
+        Only integer columns keep Arrow's inferred type. Every other column is
+        read as text and converted by ``_coerce_strings``, so values match the
+        pandas reader used for previews: integers wider than 64 bits stay
+        exact, and ``nan``/``inf`` literals stay text.
+
+        Args:
+            file_content: Raw file content (bytes or a read-only mmap)
+            encoding: File encoding
+            delimiter: Field delimiter
+
+        Returns:
+            DataFrame with pandas-style column names, or None if Arrow
+            rejects the file (the caller falls back to pandas then)
+        """
+        try:
+            # Arrow may still hold views of the buffer after the table is
+            # converted, so it gets bytes rather than the caller's mmap
+            source = pa.py_buffer(bytes(file_content))
+            read_options = pacsv.ReadOptions(encoding=encoding)
+            parse_options = pacsv.ParseOptions(delimiter=delimiter)
+            convert_options = pacsv.ConvertOptions(
+                null_values=NA_VALUES, strings_can_be_null=True
+            )
+
+            # Column types are inferred from the first block
+            schema = pacsv.open_csv(
+                pa.BufferReader(source),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            ).schema
+            convert_options.column_types = {
+                field.name: pa.string()
+                for field in schema
+                if not pa.types.is_integer(field.type)
+            }
+
+            table = pacsv.read_csv(
+                pa.BufferReader(source),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+        except (pa.ArrowException, LookupError, UnicodeDecodeError) as e:
+            logger.info(f"Arrow CSV reader failed, using pandas: {str(e)}")
+            return None
+
+        table = table.rename_columns(self._dedupe_column_names(table.column_names))
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
+    def _dedupe_column_names(self, names: List[str]) -> List[str]:
+        """Name blank and duplicate headers the way pandas.read_csv does."""
+        counts: Dict[str, int] = {}
+        result = []
+        for index, name in enumerate(names):
+            name = name or f"Unnamed: {index}"
+            count = counts.get(name, 0)
+            while count > 0:
+                counts[name] = count + 1
+                name = f"{name}.{count}"
+                count = counts.get(name, 0)
+            counts[name] = count + 1
+            result.append(name)
+        return result
+
+    def detect_format(self, file_path: Path) -> Tuple[str, str]:
+        """
+        Detect encoding and delimiter of a delimited text file from its head.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            Tuple of (encoding, delimiter)
+        """
+        with open(file_path, "rb") as f:
+            head = f.read(SNIFF_SAMPLE_SIZE)
+
+        encoding = self._detect_encoding(head)
+        if encoding.lower() == "ascii":
+            # An ASCII head says nothing about the rest of the file
+            encoding = "utf-8"
+
+        delimiter = self._detect_delimiter(head.decode(encoding, errors="ignore"))
+        return encoding, delimiter
+
+    def iter_chunks(
+        self,
+        file_path: Path,
+        chunksize: int,
+        encoding: Optional[str] = None,
+        delimiter: Optional[str] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read a delimited text file in chunks of rows.
+
+        Args:
+            file_path: Path of the file
+            chunksize: Number of rows per chunk
+            encoding: File encoding (detected when omitted)
+            delimiter: Field delimiter (detected when omitted)
+
+        Yields:
+            DataFrame chunks with cleaned column names
+        """
+        if encoding is None or delimiter is None:
+            detected_encoding, detected_delimiter = self.detect_format(file_path)
+            encoding = encoding or detected_encoding
+            delimiter = delimiter or detected_delimiter
+
+        reader = pd.read_csv(
+            file_path,
+            delimiter=delimiter,
+            encoding=encoding,
+            encoding_errors="ignore",
+            chunksize=chunksize,
+            keep_default_na=False,
+            na_values=NA_VALUES,
+        )
+        with reader:
+            for chunk in reader:
+                chunk.columns = [self._clean_column_name(col) for col in chunk.columns]
+                yield chunk
+
+    def iter_records(
+        self, file_path: Path, batch_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield processed rows of a delimited text file batch by batch.
+
+        Only one batch of rows is held in memory at a time.
+
+        Args:
+            file_path: Path of the file
+            batch_size: Number of rows parsed per batch (defaults to CHUNK_SIZE)
+
+        Yields:
+            Row dictionaries with processed values
+        """
+        for chunk in self.iter_chunks(file_path, batch_size or _SETTINGS.CHUNK_SIZE):
+            yield from self.frame_to_records(chunk)
+
+    def frame_to_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a DataFrame into a list of row dictionaries with processed values.
+
+        Args:
+            df: DataFrame with cleaned column names
+
+        Returns:
+            List of row dictionaries
+        """
+        headers = df.columns.tolist()
+        columns = [self._coerce_column(df.iloc[:, i]) for i in range(len(headers))]
+        return [dict(zip(headers, row)) for row in zip(*columns)]
+
+    def _coerce_column(self, column: pd.Series) -> List[Any]:
+        """
+        Convert a column to Python values column-wise.
+
+        Produces the same values as applying ``_process_cell_value`` to every
+        cell, but with vectorized pandas/NumPy operations per column.
+
+        Args:
+            column: Column as parsed by pandas
+
+        Returns:
+            List of processed cell values
+        """
+        missing = column.isna().to_numpy()
+
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_integer_dtype(
+            column
+        ):
+            values = column.to_numpy(dtype=object)
+        elif pd.api.types.is_float_dtype(column):
+            values = self._coerce_floats(column.to_numpy(dtype=float))
+        elif pd.api.types.infer_dtype(column, skipna=True) == "string":
+            values = self._coerce_strings(column)
+        else:
+            values = np.array(
+                [self._process_cell_value(value) for value in column], dtype=object
+            )
+
+        values[missing] = None
+        return values.tolist()
+
+    def _coerce_floats(self, values: np.ndarray) -> np.ndarray:
+        """Convert floats to Python numbers, turning integral values into ints."""
+        result = values.astype(object)
+        with np.errstate(invalid="ignore"):
+            integral = np.isfinite(values) & (np.mod(values, 1) == 0)
+        small = integral & (np.abs(values) < 2**63)
+        result[small] = values[small].astype(np.int64).astype(object)
+        huge = integral & ~small
+        if huge.any():
+            result[huge] = [int(value) for value in values[huge]]
+        return result
+
+    def _coerce_strings(self, column: pd.Series) -> np.ndarray:
+        """Strip strings and convert numeric/boolean text in a string column."""
+        stripped = column.str.strip()
+
+        # Columns of numerals with a decimal point or exponent are floats, as
+        # the pandas C parser reads them; all-integer columns stay exact below
+        present = stripped.dropna()
+        if (
+            len(present)
+            and present.str.fullmatch(FLOAT_PATTERN).all()
+            and not present.str.fullmatch(INTEGER_PATTERN).all()
+        ):
+            return self._coerce_floats(stripped.astype(float).to_numpy())
+
+        result = stripped.to_numpy(dtype=object, copy=True)
+
+        # Integers without a decimal point keep full precision via int()
+        is_int = stripped.str.fullmatch(INTEGER_PATTERN, na=False)
+        if is_int.any():
+            result[is_int.to_numpy()] = stripped[is_int].map(int).to_numpy(
+                dtype=object
+            )
+
+        # Decimals are parsed as floats
+        is_decimal = stripped.str.fullmatch(DECIMAL_PATTERN, na=False)
+        if is_decimal.any():
+            result[is_decimal.to_numpy()] = self._coerce_floats(
+                stripped[is_decimal].astype(float).to_numpy()
+            )
+
+        lowered = stripped.str.lower()
+        is_bool = lowered.isin(list(BOOLEAN_VALUES)).to_numpy()
+        if is_bool.any():
+            result[is_bool] = lowered[is_bool].map(BOOLEAN_VALUES).to_numpy(
+                dtype=object
+            )
+
+        result[(stripped == "").to_numpy()] = None
+        return result
+
+    def _count_lines(self, file_content: bytes, encoding: str) -> int:
+        """
+        Count the lines of a delimited text file without decoding it.
+
+        Newlines are counted on the raw bytes block by block, which is exact
+        for every ASCII-compatible encoding. UTF-16/32 files are decoded.
+
+        Args:
+            file_content: Raw file content (bytes or a read-only mmap)
+            encoding: File encoding
+
+        Returns:
+            Number of lines, including a final line without a newline
+        """
+        if encoding.lower().replace("_", "-").startswith(("utf-16", "utf-32")):
+            text_content = str(file_content, encoding, "ignore")
+            newlines = text_content.count("\n")
+            unterminated = bool(text_content) and not text_content.endswith("\n")
+        else:
+            newlines = sum(
+                file_content[offset : offset + COUNT_BLOCK_SIZE].count(b"\n")
+                for offset in range(0, len(file_content), COUNT_BLOCK_SIZE)
+            )
+            unterminated = len(file_content) > 0 and file_content[-1:] != b"\n"
+        return newlines + unterminated
+
     def _detect_encoding(self, file_content: bytes) -> str:
         """
         Detect file encoding.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content (bytes or a read-only mmap)
 
         Returns:
             Detected encoding
         """
         try:
-            # Use chardet to detect encoding
-            result = chardet.detect(file_content)
-            encoding = result.get("encoding", "utf-8")
-
-            # Fallback to common encodings if detection fails
-            if not encoding or result.get("confidence", 0) < 0.7:
-                for enc in ["utf-8", "latin-1", "cp1252", "iso-8859-1"]:
-                    try:
-                        file_content.decode(enc)
-                        return enc
-                    except UnicodeDecodeError:
-                        continue
-                return "utf-8"  # Final fallback
-
-            return encoding
-
+            return detect_encoding(file_content)
         except Exception:
             return "utf-8"
 
@@ -179,30 +522,35 @@ class CSVProcessor:
             return "Unnamed_Column"
 
         # Remove or replace problematic characters
-        cleaned = "".join(
-            c if c.isalnum() or c in ["_", "-", " "] else "_" for c in cleaned
-        )
+        cleaned = COLUMN_NAME_INVALID.sub("_", cleaned)
 
         # Replace multiple spaces/underscores with single underscore
-        import re
-
-        cleaned = re.sub(r"[\s_]+", "_", cleaned)
+        cleaned = COLUMN_NAME_SEPARATORS.sub("_", cleaned)
 
         # Remove leading/trailing underscores
         cleaned = cleaned.strip("_")
 
-        return cleaned or "Unnamed_Column"
+        # Interned so every row dict shares the same key objects
+        return sys.intern(cleaned) if cleaned else "Unnamed_Column"
 
     def _process_cell_value(self, value: Any) -> Any:
         """
         Process individual cell value and convert to appropriate Python type.
 
+        Common scalar types are looked up by exact type in ``CELL_HANDLERS``;
+        anything else (subclasses, pandas NA types) goes through the generic
+        checks.
+
         Args:
             value: Raw cell value from pandas
 
         Returns:
             Processed cell value
         """
+        handler = CELL_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value)
+
         # Handle pandas NA/NaN values
         if pd.isna(value):
             return None
@@ -217,44 +565,47 @@ class CSVProcessor:
                 return int(value)
             return value
 
-        # Handle boolean values
-        if isinstance(value, bool):
-            return value
-
         # Handle string values
         if isinstance(value, str):
-            cleaned = value.strip()
+            return _text_cell_value(value)
 
-            # Return None for empty strings
-            if not cleaned:
-                return None
+        return str(value)
 
-            # Try to convert to number
-            if self._is_number(cleaned):
-                try:
-                    if "." in cleaned:
-                        float_val = float(cleaned)
-                        return int(float_val) if float_val.is_integer() else float_val
-                    else:
-                        return int(cleaned)
-                except ValueError:
-                    pass
+    async def process_file_async(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Process a delimited text file off the event loop (see ``app.core.executor``).
 
-            # Try to convert to boolean
-            if cleaned.lower() in ("true", "false", "yes", "no"):
-                return cleaned.lower() in ("true", "yes")
+        The file is read inside the worker so only its path crosses the
+        process boundary.
 
-            return cleaned
+        Args:
+            file_path: Path of the file
 
-        return str(value) if value is not None else None
+        Returns:
+            Dictionary containing processed data and metadata
+        """
+        return await run_in_process(_process_path, file_path)
 
-    def _is_number(self, value: str) -> bool:
-        """Check if a string represents a number."""
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+    async def get_preview_async(
+        self, file_path: Path, max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a preview of a delimited text file off the event loop.
+
+        Previews are cached by file contents (see ``app.utils.cache``).
+
+        Args:
+            file_path: Path of the file
+            max_rows: Maximum number of rows to preview
+
+        Returns:
+            Dictionary containing preview data
+        """
+        return await cached_file_result(
+            file_path,
+            ("csv.preview", max_rows),
+            lambda: run_in_process(_preview_path, file_path, max_rows),
+        )
 
     def get_preview(
         self, file_content: bytes, filename: str, max_rows: int = None
@@ -263,14 +614,14 @@ class CSVProcessor:
         Get a preview of the delimited text file data.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content (bytes or a read-only mmap)
             filename: Original filename
             max_rows: Maximum number of rows to preview
 
         Returns:
             Dictionary containing preview data
         """
-        max_rows = max_rows or self.settings.MAX_ROWS_PREVIEW
+        max_rows = max_rows or _MAX_ROWS_PREVIEW
 
         try:
             file_ext = Path(filename).suffix.lower().lstrip(".") or "csv"
@@ -279,37 +630,43 @@ class CSVProcessor:
 
             logger.info(f"Generating preview for {file_ext.upper()} file: {filename}")
 
-            # Detect encoding and delimiter
+            # Detect encoding and delimiter from the head of the file
             encoding = self._detect_encoding(file_content)
-            try:
-                text_content = file_content.decode(encoding)
-            except (LookupError, UnicodeDecodeError):
-                text_content = file_content.decode("utf-8", errors="ignore")
-            delimiter = self._detect_delimiter(text_content)
-
-            # Read limited rows for preview
-            df = pd.read_csv(
-                StringIO(text_content),
-                delimiter=delimiter,
-                nrows=max_rows,
-                keep_default_na=False,
-                na_values=["", "NA", "N/A", "null", "NULL", "None"],
+            delimiter = self._detect_delimiter(
+                str(file_content[:SNIFF_SAMPLE_SIZE], encoding, "ignore")
             )
 
+            # Parse only as much of the head as the preview needs, growing the
+            # sample when quoted newlines leave it short of max_rows
+            sample_size = PREVIEW_SAMPLE_SIZE
+            while True:
+                sample = file_content[:sample_size]
+                complete = len(sample) >= len(file_content)
+                if not complete:
+                    # Cut after the last full line
+                    sample = sample[: sample.rfind(b"\n") + 1] or sample
+
+                df = pd.read_csv(
+                    BytesIO(sample),
+                    delimiter=delimiter,
+                    encoding=encoding,
+                    encoding_errors="ignore",
+                    nrows=max_rows,
+                    keep_default_na=False,
+                    na_values=NA_VALUES,
+                )
+                if complete or len(df) >= max_rows:
+                    break
+                sample_size *= 4
+
             # Clean column names
             df.columns = [self._clean_column_name(col) for col in df.columns]
 
             # Process preview data
-            preview_data = []
-            for _, row in df.iterrows():
-                row_data = {}
-                for col in df.columns:
-                    value = row[col]
-                    row_data[col] = self._process_cell_value(value)
-                preview_data.append(row_data)
+            preview_data = self.frame_to_records(df)
 
             # Get total row count
-            total_rows = max(sum(1 for _ in StringIO(text_content)) - 1, 0)
+            total_rows = max(self._count_lines(file_content, encoding) - 1, 0)
 
             return {
                 "filename": filename,
@@ -329,3 +686,15 @@ class CSVProcessor:
 
 # Global processor instance
 csv_processor = CSVProcessor()
+
+
+def _process_path(file_path: Path) -> Dict[str, Any]:
+    """Process a file by path (runs in an executor worker)."""
+    with mapped_file(file_path) as content:
+        return csv_processor.process_file(content, file_path.name)
+
+
+def _preview_path(file_path: Path, max_rows: Optional[int]) -> Dict[str, Any]:
+    """Preview a file by path (runs in an executor worker)."""
+    with mapped_file(file_path) as content:
+        return csv_processor.get_preview(content, file_path.name, max_rows)
@@ -2,30 +2,95 @@
 
 import pandas as pd
 import openpyxl
-from typing import Dict, List, Any, Optional, Union
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 from pathlib import Path
 from io import BytesIO
 import logging
-from datetime import datetime, timezone
+import sys
+from datetime import date, datetime, time, timezone
 
 from app.core.config import get_settings
 from app.core.exceptions import FileProcessingError
+from app.core.executor import run_in_process
+from app.utils.cache import cached_file_result
+
+try:
+    # Probe optional Rust-backed reader; openpyxl is used without it
+    from python_calamine import CalamineWorkbook  # type: ignore
+
+    HAVE_CALAMINE = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_CALAMINE = False
 
 logger = logging.getLogger(__name__)
 
+_SETTINGS = get_settings()
+_MAX_ROWS_PREVIEW = _SETTINGS.MAX_ROWS_PREVIEW
+
+
+def _float_cell_value(value: float) -> Any:
+    """Convert a float cell, turning whole numbers into int."""
+    return int(value) if value.is_integer() else value
+
+
+def _text_cell_value(value: str) -> Any:
+    """Convert a text cell: numerals to numbers and yes/no/1/0 to bool."""
+    # Clean up whitespace
+    cleaned = value.strip()
+
+    # Try to convert to number if it looks like one
+    if cleaned.replace(".", "").replace("-", "").replace("+", "").isdigit():
+        try:
+            if "." in cleaned:
+                float_val = float(cleaned)
+                if float_val.is_integer():
+                    return int(float_val)
+                return float_val
+            else:
+                return int(cleaned)
+        except ValueError:
+            pass
+
+    # Try to convert to boolean
+    if cleaned.lower() in ("true", "false", "yes", "no", "1", "0"):
+        return cleaned.lower() in ("true", "yes", "1")
+
+    return cleaned
+
+
+# Cell conversions keyed by exact type, checked before the generic path
+CELL_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    str: _text_cell_value,
+    float: _float_cell_value,
+    int: lambda value: value,
+    bool: lambda value: value,
+    type(None): lambda value: None,
+    datetime: lambda value: value.isoformat(),
+}
+
 
 class ExcelProcessor:
     """Processes Excel files and converts them to structured data."""
 
-    def __init__(self):
-        self.settings = get_settings()
-
-    def process_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def process_file(
+        self, file_content: Union[bytes, Path], filename: str
+    ) -> Dict[str, Any]:
         """
         Process Excel file and extract structured data.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content as bytes, or the path of the file
             filename: Original filename
 
         Returns:
@@ -34,25 +99,17 @@ class ExcelProcessor:
         try:
             logger.info(f"Processing Excel file: {filename}")
 
-            # Load workbook
-            workbook = openpyxl.load_workbook(BytesIO(file_content), data_only=True)
-
-            # Get all sheet names
-            sheet_names = workbook.sheetnames
-            logger.info(f"Found {len(sheet_names)} sheets: {sheet_names}")
-
-            # Process each sheet
-            processed_data = {}
-            for sheet_name in sheet_names:
+            processed_data = None
+            if HAVE_CALAMINE:
                 try:
-                    sheet_data = self._process_sheet(workbook, sheet_name)
-                    if sheet_data:  # Only include non-empty sheets
-                        processed_data[sheet_name] = sheet_data
+                    processed_data = self._calamine_sheets(file_content)
                 except Exception as e:
-                    logger.warning(f"Failed to process sheet '{sheet_name}': {str(e)}")
-                    continue
+                    logger.warning(
+                        f"Calamine processing failed, falling back to openpyxl: {str(e)}"
+                    )
 
-            workbook.close()
+            if processed_data is None:
+                processed_data = self._openpyxl_sheets(file_content)
 
             if not processed_data:
                 raise FileProcessingError("No valid data found in Excel file")
@@ -74,6 +131,122 @@ class ExcelProcessor:
             logger.error(f"Failed to process Excel file {filename}: {str(e)}")
             raise FileProcessingError(f"Excel processing failed: {str(e)}")
 
+    def _workbook_source(
+        self, file_content: Union[bytes, Path]
+    ) -> Union[BytesIO, Path]:
+        """
+        Get an object openpyxl can load a workbook from.
+
+        Paths are handed over as-is so the archive members are read from disk on
+        demand instead of loading the whole file into memory first.
+        """
+        if isinstance(file_content, Path):
+            return file_content
+        return BytesIO(file_content)
+
+    def _openpyxl_workbook(self, file_content: Union[bytes, Path]):
+        """
+        Open a workbook with openpyxl in read-only mode.
+
+        Read-only workbooks stream rows from the archive instead of building a
+        Cell object for every cell, but keep the archive open until closed.
+        """
+        return openpyxl.load_workbook(
+            self._workbook_source(file_content),
+            data_only=True,
+            read_only=True,
+            keep_links=False,
+        )
+
+    def _calamine_workbook(self, file_content: Union[bytes, Path]):
+        """Open a workbook with python-calamine."""
+        if isinstance(file_content, Path):
+            return CalamineWorkbook.from_path(str(file_content))
+        return CalamineWorkbook.from_filelike(BytesIO(file_content))
+
+    def _calamine_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[List[Any]]:
+        """
+        Normalize calamine cell values to what openpyxl would return.
+
+        Calamine reports empty cells as "" and date-only cells as ``date``,
+        openpyxl as None and ``datetime``.
+        """
+        for row in rows:
+            yield [
+                None
+                if cell == ""
+                else datetime.combine(cell, time())
+                if type(cell) is date
+                else cell
+                for cell in row
+            ]
+
+    def _calamine_sheets(
+        self, file_content: Union[bytes, Path]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process all sheets with python-calamine.
+
+        Args:
+            file_content: Raw file content as bytes, or the path of the file
+
+        Returns:
+            Dictionary of non-empty sheet data keyed by sheet name
+        """
+        workbook = self._calamine_workbook(file_content)
+        logger.info(
+            f"Found {len(workbook.sheet_names)} sheets: {workbook.sheet_names}"
+        )
+
+        processed_data = {}
+        for sheet_name in workbook.sheet_names:
+            try:
+                sheet = workbook.get_sheet_by_name(sheet_name)
+                rows = self._calamine_rows(sheet.to_python(skip_empty_area=False))
+                sheet_data = self._build_sheet_data(rows, sheet_name)
+                if sheet_data:  # Only include non-empty sheets
+                    processed_data[sheet_name] = sheet_data
+            except Exception as e:
+                logger.warning(f"Failed to process sheet '{sheet_name}': {str(e)}")
+                continue
+
+        return processed_data
+
+    def _openpyxl_sheets(
+        self, file_content: Union[bytes, Path]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process all sheets with openpyxl.
+
+        Args:
+            file_content: Raw file content as bytes, or the path of the file
+
+        Returns:
+            Dictionary of non-empty sheet data keyed by sheet name
+        """
+        workbook = self._openpyxl_workbook(file_content)
+        try:
+            # Get all sheet names
+            sheet_names = workbook.sheetnames
+            logger.info(f"Found {len(sheet_names)} sheets: {sheet_names}")
+
+            # Process each sheet
+            processed_data = {}
+            for sheet_name in sheet_names:
+                try:
+                    sheet_data = self._process_sheet(workbook, sheet_name)
+                    if sheet_data:  # Only include non-empty sheets
+                        processed_data[sheet_name] = sheet_data
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to process sheet '{sheet_name}': {str(e)}"
+                    )
+                    continue
+
+            return processed_data
+        finally:
+            workbook.close()
+
     def _process_sheet(
         self, workbook: openpyxl.Workbook, sheet_name: str
     ) -> Optional[Dict[str, Any]]:
@@ -89,65 +262,89 @@ class ExcelProcessor:
         """
         try:
             worksheet = workbook[sheet_name]
+            return self._build_sheet_data(
+                worksheet.iter_rows(values_only=True), sheet_name
+            )
 
-            # Convert to pandas DataFrame for easier processing
-            data = []
-            headers = []
+        except Exception as e:
+            logger.error(f"Failed to process sheet {sheet_name}: {str(e)}")
+            return None
 
-            # Get all rows with data
-            rows = list(worksheet.iter_rows(values_only=True))
-            if not rows:
-                return None
+    def _sheet_headers(self, header_row: Sequence[Any]) -> List[str]:
+        """
+        Build column names from a header row.
 
-            # Remove completely empty rows
-            rows = [row for row in rows if any(cell is not None for cell in row)]
-            if not rows:
-                return None
+        Names are interned so every row dict shares the same key objects.
+        """
+        return [
+            sys.intern(str(cell)) if cell is not None else f"Column_{i+1}"
+            for i, cell in enumerate(header_row)
+        ]
 
-            # First row as headers
-            headers = [
-                str(cell) if cell is not None else f"Column_{i+1}"
-                for i, cell in enumerate(rows[0])
-            ]
+    def _build_sheet_data(
+        self, rows: Iterable[Sequence[Any]], sheet_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the data of a single sheet from its raw row values.
 
-            # Process data rows
-            for row in rows[1:]:
-                row_data = {}
-                for i, cell in enumerate(row):
-                    if i < len(headers):
-                        # Convert cell value to appropriate type
-                        processed_value = self._process_cell_value(cell)
-                        row_data[headers[i]] = processed_value
+        Rows are consumed lazily, so the raw sheet is never held in memory
+        alongside the processed rows.
 
-                # Only add row if it has at least one non-null value
-                if any(value is not None for value in row_data.values()):
-                    data.append(row_data)
+        Args:
+            rows: Raw values of all rows, header first
+            sheet_name: Name of the sheet
 
-            if not data:
-                return None
+        Returns:
+            Dictionary containing sheet data and metadata, or None if empty
+        """
+        data = []
 
-            return {
-                "headers": headers,
-                "data": data,
-                "row_count": len(data),
-                "column_count": len(headers),
-                "sheet_name": sheet_name,
-            }
+        # Skip completely empty rows
+        rows = (row for row in rows if any(cell is not None for cell in row))
 
-        except Exception as e:
-            logger.error(f"Failed to process sheet {sheet_name}: {str(e)}")
+        # First row as headers
+        header_row = next(rows, None)
+        if header_row is None:
+            return None
+        headers = self._sheet_headers(header_row)
+
+        # Process data rows; zip drops cells beyond the header width
+        process_cell = self._process_cell_value
+        for row in rows:
+            row_data = dict(zip(headers, map(process_cell, row)))
+
+            # Only add row if it has at least one non-null value
+            if any(value is not None for value in row_data.values()):
+                data.append(row_data)
+
+        if not data:
             return None
 
+        return {
+            "headers": headers,
+            "data": data,
+            "row_count": len(data),
+            "column_count": len(headers),
+            "sheet_name": sheet_name,
+        }
+
     def _process_cell_value(self, cell_value: Any) -> Any:
         """
         Process individual cell value and convert to appropriate Python type.
 
+        Common scalar types are looked up by exact type in ``CELL_HANDLERS``;
+        anything else goes through the generic checks.
+
         Args:
-            cell_value: Raw cell value from openpyxl
+            cell_value: Raw cell value from openpyxl or python-calamine
 
         Returns:
             Processed cell value
         """
+        handler = CELL_HANDLERS.get(type(cell_value))
+        if handler is not None:
+            return handler(cell_value)
+
         if cell_value is None:
             return None
 
@@ -162,107 +359,218 @@ class ExcelProcessor:
                 return int(cell_value)
             return cell_value
 
-        # Handle boolean values
-        if isinstance(cell_value, bool):
-            return cell_value
-
         # Handle string values
         if isinstance(cell_value, str):
-            # Clean up whitespace
-            cleaned = cell_value.strip()
-
-            # Try to convert to number if it looks like one
-            if cleaned.replace(".", "").replace("-", "").replace("+", "").isdigit():
-                try:
-                    if "." in cleaned:
-                        float_val = float(cleaned)
-                        if float_val.is_integer():
-                            return int(float_val)
-                        return float_val
-                    else:
-                        return int(cleaned)
-                except ValueError:
-                    pass
-
-            # Try to convert to boolean
-            if cleaned.lower() in ("true", "false", "yes", "no", "1", "0"):
-                return cleaned.lower() in ("true", "yes", "1")
-
-            return cleaned
+            return _text_cell_value(cell_value)
 
         # Return as string for any other type
         return str(cell_value)
 
+    async def process_file_async(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Process an Excel file off the event loop (see ``app.core.executor``).
+
+        The file is read inside the worker so only its path crosses the
+        process boundary.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            Dictionary containing processed data and metadata
+        """
+        return await run_in_process(_process_path, file_path)
+
+    async def get_preview_async(
+        self, file_path: Path, max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a preview of an Excel file off the event loop.
+
+        Previews are cached by file contents (see ``app.utils.cache``).
+
+        Args:
+            file_path: Path of the file
+            max_rows: Maximum number of rows to preview
+
+        Returns:
+            Dictionary containing preview data
+        """
+        return await cached_file_result(
+            file_path,
+            ("excel.preview", max_rows),
+            lambda: run_in_process(_preview_path, file_path, max_rows),
+        )
+
     def get_preview(
-        self, file_content: bytes, filename: str, max_rows: int = None
+        self, file_content: Union[bytes, Path], filename: str, max_rows: int = None
     ) -> Dict[str, Any]:
         """
         Get a preview of the Excel file data.
 
         Args:
-            file_content: Raw file content as bytes
+            file_content: Raw file content as bytes, or the path of the file
             filename: Original filename
             max_rows: Maximum number of rows to preview per sheet
 
         Returns:
             Dictionary containing preview data
         """
-        max_rows = max_rows or self.settings.MAX_ROWS_PREVIEW
+        max_rows = max_rows or _MAX_ROWS_PREVIEW
 
         try:
             logger.info(f"Generating preview for Excel file: {filename}")
 
-            workbook = openpyxl.load_workbook(BytesIO(file_content), data_only=True)
+            preview_data = None
+            if HAVE_CALAMINE:
+                try:
+                    preview_data = self._calamine_preview(file_content, max_rows)
+                except Exception as e:
+                    logger.warning(
+                        f"Calamine preview failed, falling back to openpyxl: {str(e)}"
+                    )
+
+            if preview_data is None:
+                preview_data = self._openpyxl_preview(file_content, max_rows)
+
+            return {
+                "filename": filename,
+                "file_type": "xlsx",
+                "sheets": preview_data,
+                "sheet_count": len(preview_data),
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to generate preview for {filename}: {str(e)}")
+            raise FileProcessingError(f"Preview generation failed: {str(e)}")
+
+    def _calamine_preview(
+        self, file_content: Union[bytes, Path], max_rows: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build sheet previews with python-calamine, stopping after max_rows.
+
+        Args:
+            file_content: Raw file content as bytes, or the path of the file
+            max_rows: Maximum number of rows to preview per sheet
+
+        Returns:
+            Dictionary of sheet previews keyed by sheet name
+        """
+        workbook = self._calamine_workbook(file_content)
+
+        preview_data = {}
+        for sheet_name in workbook.sheet_names[:3]:  # Preview max 3 sheets
+            try:
+                sheet = workbook.get_sheet_by_name(sheet_name)
+                rows = self._calamine_rows(sheet.iter_rows())
+
+                header_row = next(rows, None)
+                if header_row is None:
+                    continue
+
+                preview_data[sheet_name] = self._build_sheet_preview(
+                    header_row, islice(rows, max_rows), max(sheet.height - 1, 0)
+                )
+
+            except Exception as e:
+                logger.warning(f"Failed to preview sheet '{sheet_name}': {str(e)}")
+                continue
+
+        return preview_data
+
+    def _openpyxl_preview(
+        self, file_content: Union[bytes, Path], max_rows: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Build sheet previews with openpyxl.
+
+        Args:
+            file_content: Raw file content as bytes, or the path of the file
+            max_rows: Maximum number of rows to preview per sheet
+
+        Returns:
+            Dictionary of sheet previews keyed by sheet name
+        """
+        workbook = self._openpyxl_workbook(file_content)
+        try:
             sheet_names = workbook.sheetnames
 
             preview_data = {}
             for sheet_name in sheet_names[:3]:  # Preview max 3 sheets
                 try:
                     worksheet = workbook[sheet_name]
-                    rows = list(worksheet.iter_rows(values_only=True))
+                    rows = worksheet.iter_rows(values_only=True)
 
-                    if not rows:
+                    header_row = next(rows, None)
+                    if header_row is None:
                         continue
 
-                    # Get headers
-                    headers = [
-                        str(cell) if cell is not None else f"Column_{i+1}"
-                        for i, cell in enumerate(rows[0])
-                    ]
-
-                    # Get preview rows
-                    preview_rows = []
-                    for row in rows[1 : max_rows + 1]:
-                        row_data = {}
-                        for i, cell in enumerate(row):
-                            if i < len(headers):
-                                row_data[headers[i]] = self._process_cell_value(cell)
-                        preview_rows.append(row_data)
-
-                    preview_data[sheet_name] = {
-                        "headers": headers,
-                        "preview_data": preview_rows,
-                        "total_rows": len(rows) - 1,  # Excluding header
-                        "preview_rows": len(preview_rows),
-                    }
+                    # Read-only sheets only know their size from the optional
+                    # dimension record; without it count the remaining rows
+                    max_row = worksheet.max_row
+                    sheet_preview = self._build_sheet_preview(
+                        header_row,
+                        islice(rows, max_rows),
+                        max(max_row - 1, 0) if max_row is not None else 0,
+                    )
+                    if max_row is None:
+                        sheet_preview["total_rows"] = sheet_preview[
+                            "preview_rows"
+                        ] + sum(1 for _ in rows)
+                    preview_data[sheet_name] = sheet_preview
 
                 except Exception as e:
-                    logger.warning(f"Failed to preview sheet '{sheet_name}': {str(e)}")
+                    logger.warning(
+                        f"Failed to preview sheet '{sheet_name}': {str(e)}"
+                    )
                     continue
 
+            return preview_data
+        finally:
             workbook.close()
 
-            return {
-                "filename": filename,
-                "file_type": "xlsx",
-                "sheets": preview_data,
-                "sheet_count": len(preview_data),
-            }
+    def _build_sheet_preview(
+        self,
+        header_row: Sequence[Any],
+        data_rows: Iterable[Sequence[Any]],
+        total_rows: int,
+    ) -> Dict[str, Any]:
+        """
+        Build the preview of a single sheet.
 
-        except Exception as e:
-            logger.error(f"Failed to generate preview for {filename}: {str(e)}")
-            raise FileProcessingError(f"Preview generation failed: {str(e)}")
+        Args:
+            header_row: Raw values of the header row
+            data_rows: Raw values of the rows to preview
+            total_rows: Number of rows in the sheet, excluding the header
+
+        Returns:
+            Dictionary containing the sheet preview
+        """
+        # Get headers
+        headers = self._sheet_headers(header_row)
+
+        # Get preview rows
+        process_cell = self._process_cell_value
+        preview_rows = [dict(zip(headers, map(process_cell, row))) for row in data_rows]
+
+        return {
+            "headers": headers,
+            "preview_data": preview_rows,
+            "total_rows": total_rows,
+            "preview_rows": len(preview_rows),
+        }
 
 
 # Global processor instance
 excel_processor = ExcelProcessor()
+
+
+def _process_path(file_path: Path) -> Dict[str, Any]:
+    """Process a file by path (runs in an executor worker)."""
+    return excel_processor.process_file(file_path, file_path.name)
+
+
+def _preview_path(file_path: Path, max_rows: Optional[int]) -> Dict[str, Any]:
+    """Preview a file by path (runs in an executor worker)."""
+    return excel_processor.get_preview(file_path, file_path.name, max_rows)
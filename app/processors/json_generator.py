@@ -3,26 +3,47 @@
 import csv
 import json
 import jsonlines
-from typing import Dict, List, Any, Optional, Union
+import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Any, Optional, TextIO, Union
 from pathlib import Path
 from io import StringIO
+from itertools import chain
 import logging
 from datetime import datetime, timezone
 
 from app.core.config import get_settings
 from app.core.exceptions import ConversionError
 
+try:
+    # Probe optional orjson dependency; the stdlib encoder is used without it
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+if HAVE_ORJSON:
+    # Non-string keys and numpy scalars (from pandas frames) are encoded natively
+    # instead of going through the default hook
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+_SETTINGS = get_settings()
+
+# Output files are written through a large buffer so row-by-row writes turn
+# into few system calls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class JSONGenerator:
     """Generates JSON and JSONL files from processed data."""
 
-    def __init__(self):
-        self.settings = get_settings()
-
     def generate_output(
-        self, processed_data: Dict[str, Any], output_format: str = "json"
+        self,
+        processed_data: Dict[str, Any],
+        output_format: str = "json",
+        pretty_print: bool = True,
     ) -> str:
         """
         Generate the requested output string from processed data.
@@ -30,20 +51,45 @@ class JSONGenerator:
         Args:
             processed_data: Processed data from Excel/CSV processor
             output_format: Output format ('json', 'jsonl', or 'csv')
+            pretty_print: Indent JSON output
 
         Returns:
             Generated content string
         """
+        return self.generate_bytes(processed_data, output_format, pretty_print).decode(
+            "utf-8"
+        )
+
+    def generate_bytes(
+        self,
+        processed_data: Dict[str, Any],
+        output_format: str = "json",
+        pretty_print: bool = True,
+    ) -> bytes:
+        """
+        Generate the requested output as UTF-8 encoded bytes.
+
+        Args:
+            processed_data: Processed data from Excel/CSV processor
+            output_format: Output format ('json', 'jsonl', or 'csv')
+            pretty_print: Indent JSON output
+
+        Returns:
+            Generated content bytes
+        """
         try:
             logger.info(f"Generating {output_format.upper()} from processed data")
 
             fmt = output_format.lower()
+            generated_at = datetime.now(timezone.utc).isoformat()
             if fmt == "json":
-                return self._generate_json_format(processed_data)
+                return self._generate_json_format(
+                    processed_data, pretty_print, generated_at
+                )
             if fmt == "jsonl":
-                return self._generate_jsonl_format(processed_data)
+                return self._generate_jsonl_format(processed_data, generated_at)
             if fmt == "csv":
-                return self._generate_csv_format(processed_data)
+                return self._generate_csv_format(processed_data).encode("utf-8")
             raise ConversionError(f"Unsupported output format: {output_format}")
 
         except Exception as e:
@@ -58,15 +104,52 @@ class JSONGenerator:
         """Backward-compatible wrapper around generate_output."""
         return self.generate_output(processed_data, output_format)
 
-    def _generate_json_format(self, processed_data: Dict[str, Any]) -> str:
+    def _dumps(self, obj: Any, pretty_print: bool = False) -> bytes:
+        """
+        Serialize an object to UTF-8 encoded JSON.
+
+        orjson is used when installed; objects it cannot encode (integers
+        outside the 64-bit range) go through the stdlib encoder.
+
+        Args:
+            obj: Object to serialize
+            pretty_print: Indent the output with two spaces
+
+        Returns:
+            JSON bytes
+        """
+        if HAVE_ORJSON:
+            option = ORJSON_OPTIONS
+            if pretty_print:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self._json_serializer, option=option)
+            except orjson.JSONEncodeError:
+                # Integers wider than 64 bits; the stdlib encoder handles them
+                pass
+        return json.dumps(
+            obj,
+            indent=2 if pretty_print else None,
+            ensure_ascii=False,
+            default=self._json_serializer,
+        ).encode("utf-8")
+
+    def _generate_json_format(
+        self,
+        processed_data: Dict[str, Any],
+        pretty_print: bool = True,
+        generated_at: Optional[str] = None,
+    ) -> bytes:
         """
         Generate JSON format.
 
         Args:
             processed_data: Processed data dictionary
+            pretty_print: Indent the output
+            generated_at: ISO timestamp for the metadata (defaults to now)
 
         Returns:
-            JSON string
+            JSON bytes
         """
         try:
             # Create output structure
@@ -74,7 +157,8 @@ class JSONGenerator:
                 "metadata": {
                     "filename": processed_data.get("filename"),
                     "file_type": processed_data.get("file_type"),
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "generated_at": generated_at
+                    or datetime.now(timezone.utc).isoformat(),
                     "format": "json",
                 }
             }
@@ -108,33 +192,53 @@ class JSONGenerator:
                 output["metadata"]["delimiter"] = processed_data.get("delimiter")
                 output["data"] = processed_data.get("data", [])
 
-            # Convert to JSON string with proper formatting
-            return json.dumps(
-                output, indent=2, ensure_ascii=False, default=self._json_serializer
-            )
+            return self._dumps(output, pretty_print)
 
         except Exception as e:
             raise ConversionError(f"JSON formatting failed: {str(e)}")
 
-    def _generate_jsonl_format(self, processed_data: Dict[str, Any]) -> str:
+    def _generate_jsonl_format(
+        self, processed_data: Dict[str, Any], generated_at: Optional[str] = None
+    ) -> bytes:
         """
         Generate JSONL format.
 
         Args:
             processed_data: Processed data dictionary
+            generated_at: ISO timestamp for the metadata line (defaults to now)
 
         Returns:
-            JSONL string
+            JSONL bytes (a bytearray, returned without a final copy)
         """
-        try:
-            output_lines = []
+        # Lines are appended to one growing buffer; joining would keep every
+        # line object alive until the end and then copy them all
+        buffer = bytearray()
+        append = buffer.extend
+        for line in self.iter_json_lines(processed_data, generated_at):
+            append(line)
+        return buffer
+
+    def iter_json_lines(
+        self, processed_data: Dict[str, Any], generated_at: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Serialize processed data as JSONL one line at a time.
 
+        Args:
+            processed_data: Processed data dictionary
+            generated_at: ISO timestamp for the metadata line (defaults to now)
+
+        Yields:
+            Newline-terminated JSON lines
+        """
+        try:
             # Add metadata line
             metadata = {
                 "type": "metadata",
                 "filename": processed_data.get("filename"),
                 "file_type": processed_data.get("file_type"),
-                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "generated_at": generated_at
+                or datetime.now(timezone.utc).isoformat(),
                 "format": "jsonl",
             }
 
@@ -142,11 +246,7 @@ class JSONGenerator:
             if processed_data.get("file_type") == "xlsx":
                 metadata["sheet_count"] = processed_data.get("sheet_count", 0)
                 metadata["total_rows"] = processed_data.get("total_rows", 0)
-                output_lines.append(
-                    json.dumps(
-                        metadata, ensure_ascii=False, default=self._json_serializer
-                    )
-                )
+                yield self._dumps(metadata) + b"\n"
 
                 sheets_data = processed_data.get("sheets", {})
                 for sheet_name, sheet_data in sheets_data.items():
@@ -158,28 +258,12 @@ class JSONGenerator:
                         "column_count": sheet_data.get("column_count", 0),
                         "headers": sheet_data.get("headers", []),
                     }
-                    output_lines.append(
-                        json.dumps(
-                            sheet_metadata,
-                            ensure_ascii=False,
-                            default=self._json_serializer,
-                        )
-                    )
+                    yield self._dumps(sheet_metadata) + b"\n"
 
                     # Add data rows
-                    for row in sheet_data.get("data", []):
-                        row_with_meta = {
-                            "type": "data",
-                            "sheet_name": sheet_name,
-                            **row,
-                        }
-                        output_lines.append(
-                            json.dumps(
-                                row_with_meta,
-                                ensure_ascii=False,
-                                default=self._json_serializer,
-                            )
-                        )
+                    yield from self.iter_data_lines(
+                        sheet_data.get("data", []), sheet_name
+                    )
 
             # Handle CSV/TSV files (single sheet)
             elif processed_data.get("file_type") in {"csv", "tsv"}:
@@ -188,30 +272,62 @@ class JSONGenerator:
                 metadata["headers"] = processed_data.get("headers", [])
                 metadata["encoding"] = processed_data.get("encoding")
                 metadata["delimiter"] = processed_data.get("delimiter")
-                output_lines.append(
-                    json.dumps(
-                        metadata, ensure_ascii=False, default=self._json_serializer
-                    )
-                )
+                yield self._dumps(metadata) + b"\n"
 
                 # Add data rows
-                for row in processed_data.get("data", []):
-                    row_with_meta = {"type": "data", **row}
-                    output_lines.append(
-                        json.dumps(
-                            row_with_meta,
-                            ensure_ascii=False,
-                            default=self._json_serializer,
-                        )
-                    )
-
-            return "\n".join(output_lines)
+                yield from self.iter_data_lines(processed_data.get("data", []))
 
         except Exception as e:
             raise ConversionError(f"JSONL formatting failed: {str(e)}")
 
+    def iter_data_lines(
+        self, rows: Iterable[Dict[str, Any]], sheet_name: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Serialize data rows as JSONL lines.
+
+        Args:
+            rows: Row dictionaries
+            sheet_name: Sheet the rows belong to (Excel only)
+
+        Yields:
+            Newline-terminated JSON lines
+        """
+        # The "type"/"sheet_name" preamble is encoded once and spliced in front
+        # of each serialized row instead of copying every row into a new dict
+        if sheet_name is None:
+            preamble = {"type": "data"}
+        else:
+            preamble = {"type": "data", "sheet_name": sheet_name}
+        dumps = self._dumps
+        prefix = dumps(preamble)[:-1]
+        prefix_sep = prefix + b","
+
+        for row in rows:
+            if not row.keys().isdisjoint(preamble):
+                # Row values override the preamble, as with the dict merge
+                yield dumps({**preamble, **row}) + b"\n"
+                continue
+            body = dumps(row)
+            if body == b"{}":
+                yield prefix + b"}\n"
+            else:
+                yield prefix_sep + body[1:] + b"\n"
+
     def _generate_csv_format(self, processed_data: Dict[str, Any]) -> str:
         """Generate CSV format for tabular processed data."""
+        buffer = StringIO()
+        self.write_csv(processed_data, buffer)
+        return buffer.getvalue()
+
+    def write_csv(self, processed_data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Write tabular processed data as CSV to a text stream.
+
+        Args:
+            processed_data: Processed data dictionary
+            stream: Text stream opened with ``newline=""``
+        """
         records = processed_data.get("data")
         if records is None:
             sheets = processed_data.get("sheets")
@@ -222,26 +338,60 @@ class JSONGenerator:
         if not isinstance(records, list):
             raise ConversionError("Processed data does not contain tabular records")
 
-        headers = processed_data.get("headers") or sorted({
-            key
-            for record in records
-            if isinstance(record, dict)
-            for key in record.keys()
-        })
+        # Keys in first-seen order, like the processors report them
+        headers = processed_data.get("headers") or list(
+            dict.fromkeys(
+                chain.from_iterable(
+                    record for record in records if isinstance(record, dict)
+                )
+            )
+        )
 
         if not headers:
             headers = ["value"]
             records = [record if isinstance(record, dict) else {"value": record} for record in records]
 
-        buffer = StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=headers, extrasaction="ignore")
-        writer.writeheader()
+        # A frame needs unique column labels; duplicate headers (names that
+        # clean to the same label) are written row by row below
+        if len(set(headers)) == len(headers) and all(
+            isinstance(record, dict) for record in records
+        ):
+            self._write_csv_frame(records, headers, stream)
+            return
+
+        writer = csv.writer(stream)
+        writer.writerow(headers)
+
+        # Plain lists per row; DictWriter would build and re-read a dict per row
+        fmt = self._format_csv_value
+        headers = tuple(headers)
+        writer.writerows(
+            [fmt(record.get(header)) for header in headers] for record in records
+        )
+
+    def _write_csv_frame(
+        self, records: List[Dict[str, Any]], headers: List[str], stream: TextIO
+    ) -> None:
+        """
+        Write record dictionaries as CSV through pandas.
 
-        for record in records:
-            row = {header: self._format_csv_value(record.get(header)) for header in headers}
-            writer.writerow(row)
+        ``DataFrame.to_csv`` formats cells in C. The frame keeps object dtype so
+        values are written as ``_format_csv_value`` would (no int to float
+        upcasting around missing values), and only columns holding lists or
+        dicts are converted to JSON strings in Python.
 
-        return buffer.getvalue()
+        Args:
+            records: Row dictionaries
+            headers: Column names to write, in order
+            stream: Text stream opened with ``newline=""``
+        """
+        frame = pd.DataFrame(records, columns=headers, dtype=object)
+        for column in frame.columns:
+            values = frame[column]
+            if values.map(type).isin((list, dict)).any():
+                frame[column] = values.map(self._format_csv_value)
+        # Same line endings as csv.writer
+        frame.to_csv(stream, index=False, lineterminator="\r\n")
 
     def _format_csv_value(self, value: Any) -> Any:
         """Format cell values for CSV export."""
@@ -269,6 +419,9 @@ class JSONGenerator:
             return obj.isoformat()
         elif isinstance(obj, (set, frozenset)):
             return list(obj)
+        elif hasattr(obj, "tolist"):
+            # NumPy scalars and arrays (stdlib encoder only)
+            return obj.tolist()
         elif hasattr(obj, "__dict__"):
             return obj.__dict__
         else:
@@ -279,6 +432,7 @@ class JSONGenerator:
         processed_data: Dict[str, Any],
         output_format: str = "json",
         output_path: Optional[Path] = None,
+        pretty_print: bool = True,
     ) -> Path:
         """
         Generate an output file and save it to disk.
@@ -287,32 +441,47 @@ class JSONGenerator:
             processed_data: Processed data from Excel/CSV/JSON processors
             output_format: Output format ('json', 'jsonl', or 'csv')
             output_path: Optional output file path
+            pretty_print: Indent JSON output
 
         Returns:
             Path to generated file
         """
         try:
-            # Generate content
-            content = self.generate_output(processed_data, output_format)
-
             # Determine output path
             if not output_path:
                 filename = processed_data.get("filename", "output")
                 base_name = Path(filename).stem
                 extension = output_format.lower()
                 output_path = (
-                    self.settings.upload_path / f"{base_name}_converted.{extension}"
+                    _SETTINGS.upload_path / f"{base_name}_converted.{extension}"
                 )
 
             # Ensure directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            write_kwargs = {"encoding": "utf-8"}
-            if output_format.lower() == "csv":
-                write_kwargs["newline"] = ""
-
-            with open(output_path, "w", **write_kwargs) as f:
-                f.write(content)
+            fmt = output_format.lower()
+            if fmt == "csv":
+                # Rows go straight to the file instead of an in-memory copy
+                with open(
+                    output_path,
+                    "w",
+                    encoding="utf-8",
+                    newline="",
+                    buffering=WRITE_BUFFER_SIZE,
+                ) as f:
+                    self.write_csv(processed_data, f)
+            else:
+                with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    if fmt == "jsonl":
+                        # Write line by line so the whole document is never built
+                        f.writelines(self.iter_json_lines(processed_data))
+                    else:
+                        # Write the encoded bytes; no decode/encode round trip
+                        f.write(
+                            self.generate_bytes(
+                                processed_data, output_format, pretty_print
+                            )
+                        )
 
             logger.info(f"Generated {output_format.upper()} file: {output_path}")
             return output_path
@@ -331,7 +500,7 @@ class JSONGenerator:
         Returns:
             True if format is supported
         """
-        return output_format.lower() in self.settings.output_formats_list
+        return output_format.lower() in _SETTINGS.output_formats_set
 
     def get_supported_formats(self) -> List[str]:
         """
@@ -340,7 +509,7 @@ class JSONGenerator:
         Returns:
             List of supported formats
         """
-        return self.settings.output_formats_list.copy()
+        return list(_SETTINGS.output_formats_list)
 
     def get_format_info(self, output_format: str) -> Dict[str, Any]:
         """
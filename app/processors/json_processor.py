@@ -3,38 +3,111 @@
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import chardet
 import pandas as pd
 
 from app.core.config import get_settings
 from app.core.exceptions import FileProcessingError
+from app.core.executor import run_in_process
+from app.utils.cache import cached_file_result
+from app.utils.encoding import detect_encoding
+from app.utils.file_io import mapped_file
+
+try:
+    # Probe optional orjson dependency; the stdlib parser is used without it
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+_SETTINGS = get_settings()
+_MAX_ROWS_PREVIEW = _SETTINGS.MAX_ROWS_PREVIEW
+
+# orjson reads integers outside the 64-bit range as floats of at least this size
+INT64_LIMIT = float(2**63)
+
+# Maps ASCII digits to "0" and every other byte to a space, so digit runs can be
+# found with bytes.find instead of a regex
+DIGIT_MASK = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+
+# Shortest digit run that can spell an integer outside the 64-bit range
+WIDE_INTEGER_DIGITS = b"0" * 19
+
+# Bytes translated per step when scanning for wide integers
+SCAN_BLOCK_SIZE = 1 << 20
+
+
+def _may_hold_wide_integer(content: bytes) -> bool:
+    """Check whether raw JSON has a digit run long enough for a non-int64 integer."""
+    overlap = len(WIDE_INTEGER_DIGITS) - 1
+    for start in range(0, len(content), SCAN_BLOCK_SIZE):
+        block = content[start : start + SCAN_BLOCK_SIZE + overlap]
+        if block.translate(DIGIT_MASK).find(WIDE_INTEGER_DIGITS) >= 0:
+            return True
+    return False
+
+
+def _has_wide_integral_float(payload: Any) -> bool:
+    """Check whether parsed JSON holds an integral float outside the int64 range."""
+    stack = [payload]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        value = pop()
+        if isinstance(value, dict):
+            extend(value.values())
+        elif isinstance(value, list):
+            extend(value)
+        elif (
+            type(value) is float and abs(value) >= INT64_LIMIT and value.is_integer()
+        ):
+            return True
+    return False
+
+
+def _json_text(value: Any) -> str:
+    """Serialize a nested list or object into a JSON string cell."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+# Value conversions keyed by exact type, checked before the generic path
+VALUE_HANDLERS: Dict[type, Callable[[Any], Any]] = {
+    str: lambda value: value,
+    int: lambda value: value,
+    bool: lambda value: value,
+    float: lambda value: None if value != value else value,  # NaN -> None
+    type(None): lambda value: None,
+    list: _json_text,
+    dict: _json_text,
+    datetime: lambda value: value.isoformat(),
+}
+
 
 class JSONProcessor:
     """Processes JSON documents and converts them to tabular data."""
 
-    def __init__(self):
-        self.settings = get_settings()
-
     def process_file(self, file_content: bytes, filename: str) -> Dict[str, Any]:
-        """Parse a JSON file and extract structured records."""
+        """Parse a JSON file (bytes or a read-only mmap) and extract structured records."""
         try:
             logger.info(f"Processing JSON file: {filename}")
 
             encoding = self._detect_encoding(file_content)
             logger.debug(f"Detected encoding: {encoding}")
 
-            text_content = file_content.decode(encoding, errors="ignore")
-            data = json.loads(text_content)
+            data = self._loads(file_content, encoding)
 
-            records = self._normalize_payload(data)
-            headers = sorted({key for record in records for key in record.keys()})
+            records, sanitized = self._normalize_payload(data)
+            headers = _record_headers(records)
 
-            processed_records = [self._sanitize_record(record, headers) for record in records]
+            processed_records = (
+                records if sanitized else self._sanitize_records(records, headers)
+            )
 
             return {
                 "filename": filename,
@@ -52,11 +125,47 @@ class JSONProcessor:
             logger.error(f"Failed to process JSON file {filename}: {exc}")
             raise FileProcessingError(f"JSON processing failed: {exc}")
 
+    async def process_file_async(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Process a JSON file off the event loop (see ``app.core.executor``).
+
+        The file is read inside the worker so only its path crosses the
+        process boundary.
+
+        Args:
+            file_path: Path of the file
+
+        Returns:
+            Dictionary containing processed data and metadata
+        """
+        return await run_in_process(_process_path, file_path)
+
+    async def get_preview_async(
+        self, file_path: Path, max_rows: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a preview of a JSON file off the event loop.
+
+        Previews are cached by file contents (see ``app.utils.cache``).
+
+        Args:
+            file_path: Path of the file
+            max_rows: Maximum number of rows to preview
+
+        Returns:
+            Dictionary containing preview data
+        """
+        return await cached_file_result(
+            file_path,
+            ("json.preview", max_rows),
+            lambda: run_in_process(_preview_path, file_path, max_rows),
+        )
+
     def get_preview(
         self, file_content: bytes, filename: str, max_rows: Optional[int] = None
     ) -> Dict[str, Any]:
         """Generate a preview of the JSON content."""
-        max_rows = max_rows or self.settings.MAX_ROWS_PREVIEW
+        max_rows = max_rows or _MAX_ROWS_PREVIEW
 
         try:
             parsed = self.process_file(file_content, filename)
@@ -78,25 +187,60 @@ class JSONProcessor:
             logger.error(f"Failed to generate preview for JSON file {filename}: {exc}")
             raise FileProcessingError(f"JSON preview failed: {exc}")
 
+    def _loads(self, file_content: bytes, encoding: str) -> Any:
+        """
+        Parse JSON content.
+
+        UTF-8 content is parsed straight from the buffer with orjson, without
+        decoding it to a str first. Other encodings and documents orjson
+        rejects (NaN literals, invalid UTF-8) go through the stdlib parser on
+        the leniently decoded text. So do documents whose orjson result holds
+        an integral float outside the int64 range: orjson silently reads
+        integers that wide as floats, the stdlib parser keeps them exact. The
+        parsed result is only walked when a byte-level scan finds a digit run
+        long enough for such an integer.
+        """
+        if HAVE_ORJSON and encoding == "utf-8":
+            # Release the view before the caller unmaps the buffer
+            with memoryview(file_content) as view:
+                try:
+                    payload = orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    payload = None
+                else:
+                    if not (
+                        _may_hold_wide_integer(file_content)
+                        and _has_wide_integral_float(payload)
+                    ):
+                        return payload
+
+        return json.loads(str(file_content, encoding, "ignore"))
+
     def _detect_encoding(self, file_content: bytes) -> str:
-        """Detect file encoding with sensible fallbacks."""
+        """
+        Detect file encoding with sensible fallbacks.
+
+        JSON text starts with two ASCII characters, so a byte order mark or the
+        NUL byte pattern of the first four bytes identifies UTF-8/16/32 without
+        statistical detection. Only text that is not valid UTF-8 is handed to
+        the generic detector (for legacy 8-bit exports).
+        """
         try:
-            result = chardet.detect(file_content)
-            encoding = result.get("encoding") or "utf-8"
-
-            if result.get("confidence", 0) < 0.7:
-                for candidate in ("utf-8", "utf-8-sig", "utf-16", "latin-1"):
-                    try:
-                        file_content.decode(candidate)
-                        return candidate
-                    except UnicodeDecodeError:
-                        continue
-            return encoding
+            encoding = json.detect_encoding(bytes(file_content[:4]))
+            if encoding != "utf-8":
+                return encoding
+            return detect_encoding(file_content, fallback="latin-1")
         except Exception:
             return "utf-8"
 
-    def _normalize_payload(self, payload: Any) -> List[Dict[str, Any]]:
-        """Normalize arbitrary JSON payloads into record dictionaries."""
+    def _normalize_payload(self, payload: Any) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Normalize arbitrary JSON payloads into record dictionaries.
+
+        Returns:
+            Tuple of (records, sanitized); sanitized records already share one
+            key order and hold only JSON/CSV friendly values
+        """
         if isinstance(payload, dict):
             for key in ("data", "records", "items", "rows"):
                 candidate = payload.get(key)
@@ -104,17 +248,37 @@ class JSONProcessor:
                     payload = candidate
                     break
             else:
-                return [self._ensure_mapping(payload)]
+                return [self._ensure_mapping(payload)], False
 
         if isinstance(payload, list):
             if not payload:
-                return []
+                return [], True
             if all(isinstance(item, dict) for item in payload):
-                df = pd.json_normalize(payload, sep=".")
-                return df.fillna(value=pd.NA).to_dict(orient="records")
-            return [self._ensure_mapping({"value": item}) for item in payload]
+                # Only nested objects need flattening; flat records are used as-is
+                if not any(
+                    type(value) is dict for item in payload for value in item.values()
+                ):
+                    return payload, False
+                return self._normalize_records(payload), True
+            return [self._ensure_mapping({"value": item}) for item in payload], False
+
+        return [self._ensure_mapping({"value": payload})], False
+
+    def _normalize_records(self, payload: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Flatten nested records and sanitize them column by column.
 
-        return [self._ensure_mapping({"value": payload})]
+        Every record of the frame has every column, so the result needs no
+        per-record pass: missing cells become None and only columns holding
+        lists or objects are converted in Python.
+        """
+        df = pd.json_normalize(payload, sep=".")
+        df = df.astype(object).where(df.notna(), None)
+        for column in df.columns:
+            values = df[column]
+            if values.map(type).isin((list, dict)).any():
+                df[column] = values.map(self._process_value)
+        return df.to_dict(orient="records")
 
     def _ensure_mapping(self, value: Any) -> Dict[str, Any]:
         """Ensure the provided value is a dictionary."""
@@ -122,16 +286,26 @@ class JSONProcessor:
             return value
         return {"value": value}
 
-    def _sanitize_record(self, record: Dict[str, Any], headers: List[str]) -> Dict[str, Any]:
+    def _sanitize_records(
+        self, records: List[Dict[str, Any]], headers: List[str]
+    ) -> List[Dict[str, Any]]:
         """Coerce record values to JSON-serialisable primitives."""
-        sanitized: Dict[str, Any] = {}
-        for header in headers:
-            value = record.get(header)
-            sanitized[header] = self._process_value(value)
-        return sanitized
+        sanitize = _record_sanitizer(tuple(headers))
+        process_value = self._process_value
+        return [sanitize(record, process_value) for record in records]
 
     def _process_value(self, value: Any) -> Any:
-        """Convert values to JSON/CSV friendly representations."""
+        """
+        Convert values to JSON/CSV friendly representations.
+
+        Common types are looked up by exact type in ``VALUE_HANDLERS``; anything
+        else (pandas missing-value markers, subclasses) goes through the
+        generic checks.
+        """
+        handler = VALUE_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value)
+
         if value is None:
             return None
         try:
@@ -151,3 +325,64 @@ class JSONProcessor:
 
 
 json_processor = JSONProcessor()
+
+
+def _record_headers(records: List[Dict[str, Any]]) -> List[str]:
+    """
+    Collect the keys of all records in first-seen order.
+
+    Records usually share one schema, which is confirmed with a key-view
+    comparison per record instead of visiting every key.
+    """
+    if not records:
+        return []
+    first_keys = records[0].keys()
+    if all(record.keys() == first_keys for record in records):
+        return list(first_keys)
+    return list(dict.fromkeys(chain.from_iterable(records)))
+
+
+@lru_cache(maxsize=32)
+def _record_sanitizer(
+    headers: Tuple[str, ...]
+) -> Callable[[Dict[str, Any], Callable[[Any], Any]], Dict[str, Any]]:
+    """
+    Compile a record sanitizer specialised for a fixed set of headers.
+
+    The generated function reads every header with ``record.get`` and builds
+    the result with a single dict display. Strings and ints, which need no
+    conversion, are passed through inline; other values go to the
+    ``process_value`` callback. This avoids per-row loops over the headers
+    and a function call per plain cell.
+
+    Args:
+        headers: Column names, in output order
+
+    Returns:
+        Function taking a record and the value callback
+    """
+    lines = ["def sanitize(record, process_value):", "    get = record.get"]
+    items = []
+    for index, header in enumerate(headers):
+        lines.append(f"    v{index} = get({header!r})")
+        items.append(
+            f"{header!r}: v{index} if type(v{index}) is str or type(v{index}) is int"
+            f" else process_value(v{index})"
+        )
+    lines.append("    return {" + ", ".join(items) + "}")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["sanitize"]
+
+
+def _process_path(file_path: Path) -> Dict[str, Any]:
+    """Process a file by path (runs in an executor worker)."""
+    with mapped_file(file_path) as content:
+        return json_processor.process_file(content, file_path.name)
+
+
+def _preview_path(file_path: Path, max_rows: Optional[int]) -> Dict[str, Any]:
+    """Preview a file by path (runs in an executor worker)."""
+    with mapped_file(file_path) as content:
+        return json_processor.get_preview(content, file_path.name, max_rows)
@@ -0,0 +1,136 @@
+"""Small in-memory cache for results derived from uploaded file contents.
+
+Uploads are typically previewed several times (page reloads, different row
+limits) before they are converted. Results are keyed by a digest of the file
+contents (XXH3 when the optional ``xxhash`` package is installed, BLAKE2b
+otherwise), so a repeated request costs one hashing pass over the file instead
+of a full parse in the executor.
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from app.core.config import get_settings
+
+try:
+    # Probe optional xxhash dependency; BLAKE2b from the stdlib is used without it
+    import xxhash  # type: ignore
+
+    HAVE_XXHASH = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_XXHASH = False
+
+T = TypeVar("T")
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value (None if missing) and mark it as recently used."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the oldest entries when over capacity."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._data.clear()
+
+
+def _new_hash() -> Any:
+    """Create a 128-bit content hash object."""
+    if HAVE_XXHASH:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
+
+
+def content_digest(content: Any) -> str:
+    """
+    Hash an in-memory buffer.
+
+    Args:
+        content: Bytes-like content (bytes, memoryview or mmap)
+
+    Returns:
+        Hex digest of the content
+    """
+    digest = _new_hash()
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Hash a file's contents.
+
+    Args:
+        path: Path of the file
+        chunk_size: Number of bytes hashed per read
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = _new_hash()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+_results = LRUCache(get_settings().RESULT_CACHE_SIZE)
+
+
+async def cached_file_result(
+    file_path: Path, operation: Hashable, compute: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Get a result derived from a file, computing it only on a cache miss.
+
+    Args:
+        file_path: Path of the file the result is derived from
+        operation: Identifies the operation and its arguments
+        compute: Produces the result when it is not cached
+
+    Returns:
+        Cached or freshly computed result
+    """
+    if _results.maxsize <= 0:
+        return await compute()
+
+    # Hash off the event loop; the file name is part of the key because
+    # results echo it back
+    digest = await asyncio.to_thread(file_digest, file_path)
+    key = (digest, file_path.name, operation)
+
+    result = _results.get(key)
+    if result is None:
+        result = await compute()
+        _results.set(key, result)
+    return result
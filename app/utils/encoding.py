@@ -0,0 +1,60 @@
+"""Character encoding detection helpers."""
+
+import codecs
+from typing import Any, Union
+
+try:
+    # Probe optional charset-normalizer; cp1252 is assumed without it
+    from charset_normalizer import from_bytes  # type: ignore
+
+    HAVE_CHARSET_NORMALIZER = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_CHARSET_NORMALIZER = False
+
+# Bytes from the head of a file used to detect its encoding
+DETECT_SAMPLE_SIZE = 64 * 1024
+
+# Checked in order: the UTF-32 marks start with the UTF-16 ones
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(content: Union[bytes, Any], fallback: str = "cp1252") -> str:
+    """
+    Detect the encoding of a bytes-like buffer from its head.
+
+    A byte order mark wins; otherwise the sample is tried as UTF-8 (which also
+    covers ASCII) and only non-UTF-8 samples are handed to charset-normalizer.
+    The full buffer is never scanned.
+
+    Args:
+        content: Raw file content (bytes or a read-only mmap)
+        fallback: Encoding returned when detection is inconclusive
+
+    Returns:
+        Python codec name
+    """
+    sample = content[:DETECT_SAMPLE_SIZE]
+
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    try:
+        # Incremental decoding tolerates a character cut off at the sample end
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    if HAVE_CHARSET_NORMALIZER:
+        best = from_bytes(sample).best()
+        if best is not None:
+            return best.encoding
+
+    return fallback
@@ -0,0 +1,61 @@
+"""Helpers for reading uploaded files without copying them into memory."""
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Union
+
+
+@contextmanager
+def mapped_file(path: Union[str, Path]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Memory-map a file read-only.
+
+    The kernel pages the file in on demand, so parsers see a zero-copy buffer
+    instead of a full ``bytes`` copy of the file.
+
+    Args:
+        path: Path of the file to map
+
+    Yields:
+        Read-only mmap of the file (``b""`` for empty files, which cannot be mapped)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+@contextmanager
+def mapped_upload(spooled: IO[bytes]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Expose the contents of an upload's spooled temporary file.
+
+    Uploads that rolled over to disk are memory-mapped, so validating a large
+    upload does not copy it into a ``bytes`` object. Small uploads still held
+    in memory are returned as bytes.
+
+    Args:
+        spooled: The ``SpooledTemporaryFile`` (or plain file) behind an upload
+
+    Yields:
+        Read-only mmap of the contents, or bytes for in-memory uploads
+    """
+    # SpooledTemporaryFile.fileno() would force a rollover to disk, so look at
+    # the wrapped file object instead
+    raw = getattr(spooled, "_file", spooled)
+    if isinstance(raw, io.BytesIO):
+        yield raw.getvalue()
+        return
+
+    raw.flush()
+    fd = raw.fileno()
+    if os.fstat(fd).st_size == 0:
+        yield b""
+        return
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        yield mm
@@ -1,15 +1,20 @@
 """Application logging configuration.
 
-Provides console + rotating file handlers. If LOG_FORMAT=json is configured but
+Provides console + rotating file handlers; the file handlers are fed through a
+queue and written by background threads. If LOG_FORMAT=json is configured but
 the optional dependency python-json-logger is missing, it falls back to the
 standard formatter instead of crashing application startup.
 """
 
+import atexit
 import logging
 import logging.config
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from app.core.config import get_settings
 
@@ -21,9 +26,20 @@ try:
 except Exception:  # pragma: no cover - defensive
     HAVE_JSON_LOGGER = False
 
+# Set once logging is configured; later calls would re-open the log files
+_CONFIGURED = False
+
+# (logger, queue handler, file handler) swaps made by _queue_file_handlers
+_QUEUED_HANDLERS: List[Tuple[logging.Logger, QueueHandler, logging.Handler]] = []
+
 
 def setup_logging() -> None:
-    """Setup application logging configuration."""
+    """Setup application logging configuration (only the first call applies)."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
     settings = get_settings()
 
     # Create logs directory
@@ -122,10 +138,59 @@ def setup_logging() -> None:
             "LOG_FORMAT=json requested but python-json-logger not installed. Using text format."
         )
 
+    _queue_file_handlers(("app", "uvicorn.error"))
+
     # Set logging level for third-party libraries
     logging.getLogger("pandas").setLevel(logging.WARNING)
     logging.getLogger("openpyxl").setLevel(logging.WARNING)
-    logging.getLogger("chardet").setLevel(logging.WARNING)
+    logging.getLogger("charset_normalizer").setLevel(logging.WARNING)
+
+
+def _queue_file_handlers(logger_names: Tuple[str, ...]) -> None:
+    """
+    Move the rotating file handlers of the given loggers to background threads.
+
+    Each file handler is replaced by a ``QueueHandler`` with the same level, and
+    a ``QueueListener`` thread does the formatting, writing and rotation, so a
+    log call in a request handler is only a queue put.
+
+    Args:
+        logger_names: Names of the loggers whose file handlers are moved
+    """
+    queue_handlers: Dict[logging.Handler, QueueHandler] = {}
+    for name in logger_names:
+        target = logging.getLogger(name)
+        for handler in list(target.handlers):
+            if not isinstance(handler, RotatingFileHandler):
+                continue
+            queue_handler = queue_handlers.get(handler)
+            if queue_handler is None:
+                log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+                queue_handler = QueueHandler(log_queue)
+                queue_handler.setLevel(handler.level)
+                listener = QueueListener(log_queue, handler, respect_handler_level=True)
+                listener.start()
+                atexit.register(listener.stop)
+                queue_handlers[handler] = queue_handler
+            target.removeHandler(handler)
+            target.addHandler(queue_handler)
+            _QUEUED_HANDLERS.append((target, queue_handler, handler))
+
+    if _QUEUED_HANDLERS and hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_unqueue_file_handlers)
+
+
+def _unqueue_file_handlers() -> None:
+    """
+    Write to the file handlers directly again in a forked child.
+
+    Listener threads do not survive a fork, so records queued in a converter
+    worker process would never be written.
+    """
+    for target, queue_handler, handler in _QUEUED_HANDLERS:
+        target.removeHandler(queue_handler)
+        target.addHandler(handler)
+    _QUEUED_HANDLERS.clear()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,17 +1,111 @@
 """File validation utilities for uploaded files."""
 
+import asyncio
 import os
 import mimetypes
+import mmap
+import codecs
 import csv
 import json
-from io import StringIO
-from pathlib import Path
-from typing import Optional, Tuple
+import re
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+from functools import lru_cache
+from io import BytesIO, StringIO
+from typing import BinaryIO, Dict, FrozenSet, Optional, Tuple, Union
 from fastapi import UploadFile
 import pandas as pd
-import openpyxl
 from app.core.config import get_settings
 from app.core.exceptions import FileValidationError
+from app.core.executor import run_in_process
+from app.utils.cache import LRUCache, content_digest
+from app.utils.encoding import detect_encoding
+from app.utils.file_io import mapped_upload
+
+try:
+    # Probe optional orjson dependency; the stdlib parser is used without it
+    import orjson  # type: ignore
+
+    HAVE_ORJSON = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_ORJSON = False
+
+try:
+    # Probe optional pyarrow dependency for the C++ CSV reader
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+
+    HAVE_PYARROW = True
+except Exception:  # pragma: no cover - defensive
+    HAVE_PYARROW = False
+
+# Local file header signature every XLSX (ZIP) archive starts with
+ZIP_SIGNATURE = b"PK\x03\x04"
+
+# Archive member every XLSX workbook contains
+XLSX_WORKBOOK_PART = "xl/workbook.xml"
+XLSX_WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+
+# XML namespaces of the workbook, its relationships and worksheet parts
+SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+OFFICE_REL_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Top-left block of the active sheet probed for data (rows, columns)
+XLSX_PROBE_ROWS = 10
+XLSX_PROBE_COLUMNS = 10
+
+# Leading bytes inspected to check that content matches its extension
+MIME_SNIFF_SIZE = 512
+
+# Bytes inspected at each end of a JSON document for its enclosing brackets
+JSON_PEEK_SIZE = 4096
+
+# Leading bytes of delimited text checked for a header and a data row
+TABULAR_SAMPLE_SIZE = 8 * 1024
+
+# Deep validation of uploads at least this large runs in the process pool
+PROCESS_VALIDATION_MIN_SIZE = 8 * 1024 * 1024
+
+# Delimiter candidates counted in the first DELIMITER_SAMPLE_SIZE bytes
+DELIMITER_CANDIDATES = (b",", b"\t", b";", b"|")
+DELIMITER_SAMPLE_SIZE = 2048
+
+# Control characters that never appear in delimited or JSON text (the DOS
+# end-of-file marker \x1a is tolerated at the end of small legacy exports)
+CONTROL_CHARACTERS = re.compile("[\x00-\x08\x0b\x0e-\x19\x1b-\x1f\x7f]")
+
+# Sniffed content kinds (see FileValidator._sniff_format) accepted per extension
+SNIFFED_FORMATS = {
+    ".xlsx": frozenset({"zip"}),
+    ".csv": frozenset({"text", "json"}),
+    ".tsv": frozenset({"text", "json"}),
+    ".json": frozenset({"json"}),
+}
+
+
+@lru_cache(maxsize=1024)
+def _extension(filename: str) -> str:
+    """
+    Get the lower-cased extension of a file name, including the dot.
+
+    Same result as ``Path(filename).suffix.lower()`` for the final path
+    component, without building a path object per call.
+    """
+    name = filename[filename.rfind("/") + 1 :]
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(filename: str) -> Optional[str]:
+    """Guess a MIME type from a file name."""
+    return mimetypes.guess_type(filename)[0]
 
 
 class FileValidator:
@@ -20,15 +114,21 @@ class FileValidator:
     def __init__(self):
         self.settings = get_settings()
 
-        # MIME type mappings
-        self.mime_types = {
-            ".xlsx": [
+        # Bound once; settings are not reloaded while the app runs
+        self.allowed_extensions = self.settings.allowed_extensions_set
+
+        # Content check results of deep validation, keyed by content digest
+        self._content_cache = LRUCache(self.settings.VALIDATION_CACHE_SIZE)
+
+        # MIME type mappings (frozensets for constant-time membership checks)
+        self.mime_types: Dict[str, FrozenSet[str]] = {
+            ".xlsx": frozenset({
                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 "application/vnd.ms-excel",
-            ],
-            ".csv": ["text/csv", "application/csv", "text/plain"],
-            ".tsv": ["text/tab-separated-values", "application/tab-separated-values", "text/plain"],
-            ".json": ["application/json", "text/json", "application/octet-stream"],
+            }),
+            ".csv": frozenset({"text/csv", "application/csv", "text/plain"}),
+            ".tsv": frozenset({"text/tab-separated-values", "application/tab-separated-values", "text/plain"}),
+            ".json": frozenset({"application/json", "text/json", "application/octet-stream"}),
         }
 
     async def validate_file(self, file: UploadFile) -> Tuple[bool, Optional[str]]:
@@ -61,15 +161,23 @@ class FileValidator:
             if not self._validate_extension(file.filename):
                 return (
                     False,
-                    f"File type not allowed. Allowed types: {', '.join(sorted(self.settings.allowed_extensions_set))}",
+                    f"File type not allowed. Allowed types: {', '.join(sorted(self.allowed_extensions))}",
                 )
 
-            # Check MIME type
-            if not self._validate_mime_type(file):
+            # The MIME and content checks are independent; the content check
+            # parses off the event loop while the head is sniffed here
+            file_ext = _extension(file.filename)
+            mime_valid, content_valid = await asyncio.gather(
+                self._check_mime_type(file),
+                self._check_content(file, file_ext),
+            )
+
+            # Check MIME type against the declared type and the leading bytes
+            if not mime_valid:
                 return False, "Invalid file format or corrupted file"
 
             # Validate file content
-            if not await self._validate_content(file):
+            if not content_valid:
                 return False, "File appears to be corrupted or contains invalid data"
 
             return True, None
@@ -78,62 +186,218 @@ class FileValidator:
             return False, f"Validation error: {str(e)}"
 
     async def _validate_size(self, file: UploadFile) -> bool:
-        """Validate file size."""
-        content = await file.read()
-        await file.seek(0)  # Reset file pointer
+        """
+        Validate file size.
 
+        The size comes from the multipart parser or the spooled file's end
+        offset, so the upload is never read into memory to measure it.
+        """
         max_size = self.settings.MAX_FILE_SIZE
         if max_size is None or max_size <= 0:
             return True
 
-        return len(content) <= max_size
+        return self._file_size(file) <= max_size
+
+    def _file_size(self, file: UploadFile) -> int:
+        """Get the size of an upload without reading it."""
+        size = getattr(file, "size", None)
+        if size is None:
+            spooled = file.file
+            position = spooled.tell()
+            size = spooled.seek(0, os.SEEK_END)
+            spooled.seek(position)
+        return size
 
     def _validate_extension(self, filename: Optional[str]) -> bool:
         """Validate file extension."""
         if not filename:
             return False
 
-        file_ext = Path(filename).suffix.lower()
-        return file_ext in self.settings.allowed_extensions_set
+        return _extension(filename) in self.allowed_extensions
+
+    async def _check_mime_type(self, file: UploadFile) -> bool:
+        """Validate the MIME type of an upload against its leading bytes."""
+        head = await file.read(MIME_SNIFF_SIZE)
+        await file.seek(0)
+        return self._validate_mime_type(file, head)
 
-    def _validate_mime_type(self, file: UploadFile) -> bool:
-        """Validate MIME type."""
+    def _validate_mime_type(self, file: UploadFile, head: bytes) -> bool:
+        """
+        Validate MIME type.
+
+        Args:
+            file: FastAPI UploadFile object
+            head: Leading bytes of the upload (at most ``MIME_SNIFF_SIZE``)
+
+        Returns:
+            True if the declared type and the content both fit the extension
+        """
         if not file.filename:
             return False
 
-        file_ext = Path(file.filename).suffix.lower()
+        file_ext = _extension(file.filename)
 
-        # Check if extension is allowed
-        if file_ext not in self.mime_types:
+        # Get expected MIME types for this extension (None if not allowed)
+        expected_types = self.mime_types.get(file_ext)
+        if expected_types is None:
             return False
 
-        # Get expected MIME types for this extension
-        expected_types = self.mime_types[file_ext]
+        # The client-declared type is not trusted on its own
+        if self._sniff_format(head) not in SNIFFED_FORMATS[file_ext]:
+            return False
 
         # Check FastAPI detected content type
         if file.content_type in expected_types:
             return True
 
         # Fallback: check using mimetypes module
-        guessed_type, _ = mimetypes.guess_type(file.filename)
-        return guessed_type in expected_types
+        return _guess_mime_type(file.filename) in expected_types
 
-    async def _validate_content(self, file: UploadFile) -> bool:
-        """Validate file content by attempting to read it."""
-        try:
-            if not file.filename:
-                return False
+    def _sniff_format(self, head: bytes) -> Optional[str]:
+        """
+        Classify content by its leading bytes.
+
+        Args:
+            head: Leading bytes of the content
+
+        Returns:
+            'zip', 'json' or 'text', or None for other binary content
+        """
+        if head.startswith(ZIP_SIGNATURE):
+            return "zip"
+
+        # BOMs and the NUL pattern of UTF-16/32 text identify the encoding
+        text = head.decode(json.detect_encoding(head[:4]), errors="ignore")
+        if CONTROL_CHARACTERS.search(text):
+            return None
+        if text.lstrip("\ufeff \t\r\n")[:1] in ("{", "["):
+            return "json"
+        return "text"
+
+    async def _check_content(self, file: UploadFile, file_ext: str) -> bool:
+        """
+        Validate the content of an upload off the event loop.
+
+        Content is checked in a worker thread. Deep validation of uploads of
+        at least ``PROCESS_VALIDATION_MIN_SIZE`` bytes runs in the conversion
+        process pool instead, so pandas/XML parsing does not hold the GIL
+        of the process serving requests. Uploads over
+        ``DEEP_VALIDATION_MAX_SIZE`` only get the signature checks.
+
+        Args:
+            file: FastAPI UploadFile object
+            file_ext: Lower-cased file extension including the dot
+
+        Returns:
+            True if the content can be parsed as the given file type
+        """
+        size = self._file_size(file)
+        deep = self._deep_validation(size)
+        if not (
+            deep
+            and self.settings.PARALLEL_PROCESSING
+            and size >= PROCESS_VALIDATION_MIN_SIZE
+        ):
+            return await asyncio.to_thread(
+                self._validate_upload_content, file.file, file_ext, deep
+            )
+
+        # Only bytes cross the process boundary, so the upload is copied once
+        content = await asyncio.to_thread(self._read_upload, file.file)
 
-            file_ext = Path(file.filename).suffix.lower()
-            content = await file.read()
-            await file.seek(0)  # Reset file pointer
+        key = None
+        if self._content_cache.maxsize > 0:
+            key = (await asyncio.to_thread(content_digest, content), file_ext)
+            is_valid = self._content_cache.get(key)
+            if is_valid is not None:
+                return is_valid
 
+        is_valid = await run_in_process(validate_content, content, file_ext, deep)
+        if key is not None:
+            self._content_cache.set(key, is_valid)
+        return is_valid
+
+    def _deep_validation(self, size: int) -> bool:
+        """Check whether an upload of the given size is parsed in full."""
+        if not self.settings.DEEP_FILE_VALIDATION:
+            return False
+        max_size = self.settings.DEEP_VALIDATION_MAX_SIZE
+        return max_size <= 0 or size <= max_size
+
+    def _read_upload(self, spooled: BinaryIO) -> bytes:
+        """Read an upload's spooled file without moving its position."""
+        with mapped_upload(spooled) as content:
+            return bytes(content)
+
+    def _validate_upload_content(
+        self, spooled: BinaryIO, file_ext: str, deep: bool = False
+    ) -> bool:
+        """
+        Validate the content of an upload's spooled file.
+
+        The spooled file is mapped once and the buffer shared by the content
+        checks; its position is left untouched, so this is safe to run in a
+        worker thread while the file is read elsewhere.
+
+        Args:
+            spooled: The ``SpooledTemporaryFile`` behind the upload
+            file_ext: Lower-cased file extension including the dot
+            deep: Parse the content instead of only checking its signature
+
+        Returns:
+            True if the content can be parsed as the given file type
+        """
+        with mapped_upload(spooled) as content:
+            return self._validate_content_cached(content, file_ext, deep)
+
+    def _validate_content_cached(
+        self, content: bytes, file_ext: str, deep: bool = False
+    ) -> bool:
+        """
+        Validate file content, reusing the result for identical uploads.
+
+        Only deep validation parses enough to be worth caching; the default
+        checks read a few KiB, which is cheaper than hashing the upload.
+
+        Args:
+            content: Raw file content
+            file_ext: Lower-cased file extension including the dot
+            deep: Parse the content instead of only checking its signature
+
+        Returns:
+            True if the content can be parsed as the given file type
+        """
+        if not deep or self._content_cache.maxsize <= 0:
+            return self._validate_content(content, file_ext, deep)
+
+        key = (content_digest(content), file_ext)
+        is_valid = self._content_cache.get(key)
+        if is_valid is None:
+            is_valid = self._validate_content(content, file_ext, deep)
+            self._content_cache.set(key, is_valid)
+        return is_valid
+
+    def _validate_content(
+        self, content: bytes, file_ext: str, deep: bool = False
+    ) -> bool:
+        """
+        Validate file content by attempting to read it.
+
+        Args:
+            content: Raw file content
+            file_ext: Lower-cased file extension including the dot
+            deep: Parse the content instead of only checking its signature
+
+        Returns:
+            True if the content can be parsed as the given file type
+        """
+        try:
             if file_ext == ".xlsx":
-                return self._validate_excel_content(content)
+                return self._validate_excel_content(content, deep)
             if file_ext in {".csv", ".tsv"}:
-                return self._validate_tabular_content(content)
+                return self._validate_tabular_content(content, deep)
             if file_ext == ".json":
-                return self._validate_json_content(content)
+                return self._validate_json_content(content, deep)
 
             return False
 
@@ -141,60 +405,163 @@ class FileValidator:
             return False
 
     def _decode_text_content(self, content: bytes) -> str:
-        """Decode text content with fallback encodings."""
-        for encoding in ("utf-8", "utf-8-sig", "utf-16", "utf-16le", "utf-16be", "latin-1"):
-            try:
-                return content.decode(encoding)
-            except UnicodeDecodeError:
-                continue
-        return content.decode("utf-8", errors="ignore")
-
-    def _detect_delimiter(self, text_content: str) -> str:
-        """Detect delimiter in delimited text content."""
-        sample = text_content[:2048]
-        try:
-            sniffer = csv.Sniffer()
-            dialect = sniffer.sniff(sample, delimiters=",;	|")
-            return dialect.delimiter
-        except csv.Error:
-            counts = {d: sample.count(d) for d in [",", "	", ";", "|"]}
-            if counts:
-                return max(counts, key=counts.get)
-            return ","
-
-    def _validate_excel_content(self, content: bytes) -> bool:
-        """Validate Excel file content."""
+        """
+        Decode text content in a single pass.
+
+        The encoding is detected from the head (BOM, UTF-8 check, then
+        charset-normalizer) instead of trial-decoding the whole buffer with one
+        candidate after another.
+        """
+        encoding = detect_encoding(content, fallback="latin-1")
+        return str(content, encoding, "replace")
+
+    def _detect_delimiter(self, sample: bytes) -> str:
+        """
+        Detect delimiter in delimited text content.
+
+        The candidates are counted on the raw bytes, where each ASCII delimiter
+        appears as one byte (NUL-padded in UTF-16/32), so nothing is decoded
+        or sniffed in Python.
+
+        Args:
+            sample: Leading bytes of the content
+
+        Returns:
+            The most frequent candidate, ',' when none occurs
+        """
+        sample = bytes(sample[:DELIMITER_SAMPLE_SIZE])
+        counts = [sample.count(candidate) for candidate in DELIMITER_CANDIDATES]
+        best = max(range(len(counts)), key=counts.__getitem__)
+        return DELIMITER_CANDIDATES[best].decode() if counts[best] else ","
+
+    def _validate_excel_content(self, content: bytes, deep: bool = False) -> bool:
+        """
+        Validate Excel file content.
+
+        The ZIP signature and the workbook part in the archive's central
+        directory are checked without parsing any XML. Only with ``deep`` set
+        is the active sheet streamed to make sure it holds data.
+        """
+        if content[: len(ZIP_SIGNATURE)] != ZIP_SIGNATURE:
+            return False
+
         try:
-            # Try to load with openpyxl
-            from io import BytesIO
+            with zipfile.ZipFile(self._as_stream(content)) as archive:
+                archive.getinfo(XLSX_WORKBOOK_PART)
+                if not deep:
+                    return True
+                return self._excel_has_data(archive)
+        except (zipfile.BadZipFile, KeyError):
+            return False
 
-            workbook = openpyxl.load_workbook(BytesIO(content))
+    def _as_stream(self, content: Union[bytes, mmap.mmap]) -> BinaryIO:
+        """Get a seekable stream over content without copying a mapped file."""
+        if isinstance(content, mmap.mmap):
+            content.seek(0)
+            return content
+        return BytesIO(content)
 
-            # Check if workbook has at least one worksheet
-            if not workbook.worksheets:
+    def _excel_has_data(self, archive: zipfile.ZipFile) -> bool:
+        """
+        Check that the active sheet of a workbook holds any data.
+
+        The sheet XML is streamed with ``iterparse`` and the parse stops at
+        the first value in the probed block, so no cell objects are built.
+        """
+        try:
+            sheet_part = self._active_sheet_part(archive)
+            if sheet_part is None:
                 return False
 
-            # Try to read at least one cell to ensure it's not completely empty
-            worksheet = workbook.active
-            has_data = False
+            with archive.open(sheet_part) as sheet:
+                for _, element in ElementTree.iterparse(sheet):
+                    tag = element.tag
+                    if tag == f"{SPREADSHEET_NS}c":
+                        if self._cell_has_value(element):
+                            return True
+                    elif tag == f"{SPREADSHEET_NS}row":
+                        row = element.get("r")
+                        if row is not None and int(row) >= XLSX_PROBE_ROWS:
+                            return False
+                        # Parsed rows are not needed again
+                        element.clear()
+                    elif tag == f"{SPREADSHEET_NS}sheetData":
+                        return False
+            return False
 
-            # Check first few rows for any data
-            for row in worksheet.iter_rows(max_row=10, max_col=10):
-                for cell in row:
-                    if cell.value is not None:
-                        has_data = True
-                        break
-                if has_data:
-                    break
+        except Exception:
+            return False
 
-            workbook.close()
-            return has_data
+    def _active_sheet_part(self, archive: zipfile.ZipFile) -> Optional[str]:
+        """Get the archive member holding the workbook's active worksheet."""
+        workbook = ElementTree.fromstring(archive.read(XLSX_WORKBOOK_PART))
+        sheets = workbook.findall(f"{SPREADSHEET_NS}sheets/{SPREADSHEET_NS}sheet")
+        if not sheets:
+            return None
 
-        except Exception:
+        view = workbook.find(
+            f"{SPREADSHEET_NS}bookViews/{SPREADSHEET_NS}workbookView"
+        )
+        active = int(view.get("activeTab", 0)) if view is not None else 0
+        sheet = sheets[active] if 0 <= active < len(sheets) else sheets[0]
+        relationship_id = sheet.get(f"{OFFICE_REL_NS}id")
+
+        relationships = ElementTree.fromstring(
+            archive.read(XLSX_WORKBOOK_RELS_PART)
+        )
+        for relationship in relationships.iter(f"{PACKAGE_REL_NS}Relationship"):
+            if relationship.get("Id") == relationship_id:
+                target = relationship.get("Target", "")
+                # Targets are relative to xl/ unless absolute within the package
+                if target.startswith("/"):
+                    return target[1:]
+                return posixpath.normpath(posixpath.join("xl", target))
+        return None
+
+    def _cell_has_value(self, cell: ElementTree.Element) -> bool:
+        """Check whether a ``<c>`` element within the probed block holds a value."""
+        reference = cell.get("r", "")
+        letters = reference.rstrip("0123456789")
+        digits = reference[len(letters) :]
+        if digits and int(digits) > XLSX_PROBE_ROWS:
             return False
 
-    def _validate_json_content(self, content: bytes) -> bool:
-        """Validate JSON file content."""
+        column = 0
+        for letter in letters:
+            column = column * 26 + ord(letter) - 64
+        if column > XLSX_PROBE_COLUMNS:
+            return False
+
+        # Values are stored in <v>, inline strings in <is>
+        return (
+            cell.find(f"{SPREADSHEET_NS}v") is not None
+            or cell.find(f"{SPREADSHEET_NS}is") is not None
+        )
+
+    def _validate_json_content(self, content: bytes, deep: bool = False) -> bool:
+        """
+        Validate JSON file content.
+
+        UTF-8 documents are accepted when their first and last non-blank bytes
+        delimit an object or array; the document itself is parsed during
+        conversion. Other encodings, and every document with ``deep`` set, are
+        parsed here: by orjson straight from the bytes, and only content it
+        rejects (other encodings, NaN literals, huge integers) with the stdlib
+        parser.
+        """
+        if not deep:
+            enclosing = self._json_enclosing_bytes(content)
+            if enclosing is not None:
+                return enclosing in (b"{}", b"[]")
+
+        if HAVE_ORJSON:
+            try:
+                # orjson takes buffers but not mmap objects directly
+                with memoryview(content) as view:
+                    return isinstance(orjson.loads(view), (dict, list))
+            except orjson.JSONDecodeError:
+                pass
+
         try:
             text_content = self._decode_text_content(content)
             data = json.loads(text_content)
@@ -202,11 +569,63 @@ class FileValidator:
         except Exception:
             return False
 
-    def _validate_tabular_content(self, content: bytes) -> bool:
-        """Validate delimited text file content."""
+    def _json_enclosing_bytes(self, content: bytes) -> Optional[bytes]:
+        """
+        Get the first and last non-blank bytes of UTF-8 JSON content.
+
+        Only the ends of the buffer are inspected, nothing is copied.
+
+        Returns:
+            The two bytes, or None when the content is not UTF-8 or the ends
+            are not found within ``JSON_PEEK_SIZE`` bytes
+        """
+        head = bytes(content[:JSON_PEEK_SIZE])
+        if head.startswith(codecs.BOM_UTF8):
+            head = head[len(codecs.BOM_UTF8) :]
+        elif json.detect_encoding(head[:4]) != "utf-8":
+            return None
+
+        head = head.lstrip()
+        tail = bytes(content[-JSON_PEEK_SIZE:]).rstrip()
+        if not head or not tail:
+            return None
+        return head[:1] + tail[-1:]
+
+    def _validate_tabular_content(self, content: bytes, deep: bool = False) -> bool:
+        """
+        Validate delimited text file content.
+
+        Only the head of the file is decoded and split with ``csv.reader``; it
+        must hold a header and at least one data row. With ``deep`` set the
+        head is also parsed, with pyarrow's C++ reader when available and
+        pandas otherwise.
+        """
         try:
-            text_content = self._decode_text_content(content)
-            delimiter = self._detect_delimiter(text_content)
+            text_content = self._decode_head(content, TABULAR_SAMPLE_SIZE)
+            delimiter = self._detect_delimiter(content)
+
+            rows = (
+                row
+                for row in csv.reader(StringIO(text_content), delimiter=delimiter)
+                if row
+            )
+            if next(rows, None) is None or next(rows, None) is None:
+                return False
+
+            if not deep:
+                return True
+
+            if HAVE_PYARROW:
+                try:
+                    table = pacsv.read_csv(
+                        BytesIO(text_content.encode("utf-8")),
+                        read_options=pacsv.ReadOptions(use_threads=False),
+                        parse_options=pacsv.ParseOptions(delimiter=delimiter),
+                    )
+                    return table.num_rows > 0 and table.num_columns > 0
+                except pa.ArrowException:
+                    # Stricter than pandas (e.g. short rows); let pandas decide
+                    pass
 
             df = pd.read_csv(
                 StringIO(text_content),
@@ -221,13 +640,32 @@ class FileValidator:
         except Exception:
             return False
 
+    def _decode_head(self, content: bytes, size: int) -> str:
+        """
+        Decode the complete lines within the first bytes of text content.
+
+        Args:
+            content: Raw file content
+            size: Number of leading bytes to decode
+
+        Returns:
+            Decoded text, without a trailing partial line or character
+        """
+        head = content[:size]
+        encoding = detect_encoding(head)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        text = decoder.decode(head, final=len(head) == len(content))
+        if len(head) < len(content):
+            text = text[: text.rfind("\n") + 1] or text
+        return text
+
     def get_file_info(self, file: UploadFile) -> dict:
         """Get basic file information."""
         return {
             "filename": file.filename,
             "content_type": file.content_type,
             "size": getattr(file, "size", "unknown"),
-            "extension": Path(file.filename).suffix.lower() if file.filename else None,
+            "extension": _extension(file.filename) if file.filename else None,
         }
 
 
@@ -235,6 +673,15 @@ class FileValidator:
 file_validator = FileValidator()
 
 
+def validate_content(content: bytes, file_ext: str, deep: bool = False) -> bool:
+    """
+    Validate file content with the global validator.
+
+    Module-level so it can be submitted to the process pool.
+    """
+    return file_validator._validate_content(content, file_ext, deep)
+
+
 async def validate_uploaded_file(file: UploadFile) -> None:
     """
     Validate uploaded file and raise exception if invalid.
@@ -0,0 +1 @@
+"""Background workers for long-running conversion jobs."""
@@ -0,0 +1,254 @@
+"""Conversion job worker.
+
+Job state is kept in the shared store (see ``app.core.store``) under
+``bkv:job:{job_id}`` hashes, which expire ``TEMP_FILE_RETENTION`` seconds after
+the job finishes. Timestamps are stored as Unix epoch seconds and only turned
+into datetimes when ``JobStatusResponse`` is built. The CPU-heavy parsing and
+serialisation runs in a worker process (see ``app.core.executor``), reading the
+source file there so only paths cross the process boundary.
+"""
+
+import asyncio
+import shutil
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Set
+
+from app.core.config import get_settings
+from app.core.exceptions import ConversionError
+from app.core.executor import run_in_process
+from app.core.file_index import register_converted_file
+from app.core.store import get_store
+from app.processors.excel_processor import excel_processor
+from app.processors.csv_processor import csv_processor
+from app.processors.json_processor import json_processor
+from app.processors.json_generator import WRITE_BUFFER_SIZE, json_generator
+from app.utils.file_io import mapped_file
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Strong references to running tasks so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+# Events set on every state change of a job, for status stream subscribers
+_job_events: Dict[str, asyncio.Event] = {}
+
+FINAL_JOB_STATUSES = frozenset({"completed", "failed"})
+
+
+def job_key(job_id: str) -> str:
+    """Get the store key holding a job's state."""
+    return f"bkv:job:{job_id}"
+
+
+async def create_job(job_id: str, **fields: Any) -> None:
+    """Persist a new pending job."""
+    await get_store().hset(
+        job_key(job_id),
+        mapping={
+            "job_id": job_id,
+            "status": "pending",
+            "created_at": time.time(),
+            **fields,
+        },
+    )
+
+
+async def get_job(job_id: str) -> Dict[str, Any]:
+    """Get a job's state (empty if the job does not exist)."""
+    return await get_store().hgetall(job_key(job_id))
+
+
+async def update_job(job_id: str, **fields: Any) -> None:
+    """Update fields on an existing job."""
+    await get_store().hset(job_key(job_id), mapping=fields)
+    _notify_job(job_id)
+
+
+async def finish_job(job_id: str, **fields: Any) -> None:
+    """
+    Record a job's final state and schedule its removal from the store.
+
+    Finished jobs are kept for ``TEMP_FILE_RETENTION`` seconds so clients can
+    still poll their status, then dropped so the store does not grow forever.
+    """
+    store = get_store()
+    await store.hset(job_key(job_id), mapping=fields)
+    await store.expire(job_key(job_id), get_settings().TEMP_FILE_RETENTION)
+    _notify_job(job_id)
+
+
+def _notify_job(job_id: str) -> None:
+    """Wake up every subscriber waiting for a change of the job."""
+    event = _job_events.pop(job_id, None)
+    if event is not None:
+        event.set()
+
+
+async def watch_job(
+    job_id: str, poll_interval: float = 15.0
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield a job's state initially and after every change until it finishes.
+
+    Changes made in this process wake subscribers immediately. The store is
+    also re-read every ``poll_interval`` seconds so jobs processed by another
+    worker process (shared Redis store) are still followed.
+
+    Args:
+        job_id: Unique job identifier
+        poll_interval: Seconds to wait for a local notification before
+            re-reading the store
+
+    Yields:
+        Job state dictionaries; nothing if the job does not exist
+    """
+    last: Dict[str, Any] = {}
+    while True:
+        # Subscribe before reading so a change in between is not missed
+        event = _job_events.setdefault(job_id, asyncio.Event())
+        job = await get_job(job_id)
+        if not job:
+            return
+        if job != last:
+            last = job
+            yield job
+        if job.get("status") in FINAL_JOB_STATUSES:
+            return
+        try:
+            await asyncio.wait_for(event.wait(), poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+def enqueue_conversion(job_id: str) -> None:
+    """Schedule a conversion job to run in the background."""
+    task = asyncio.create_task(process_conversion(job_id))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def convert_to_file(
+    file_type: str,
+    source_path: Path,
+    output_path: Path,
+    output_format: str,
+    pretty_print: bool = True,
+) -> None:
+    """
+    Convert a source file and write the requested output format to disk.
+
+    Args:
+        file_type: Source file type ('xlsx', 'csv', 'tsv' or 'json')
+        source_path: Path of the uploaded file
+        output_path: Path of the output file to write
+        output_format: Output format ('json', 'jsonl', or 'csv')
+        pretty_print: Indent JSON output
+    """
+    if file_type in {"csv", "tsv"} and output_format == "jsonl":
+        stream_delimited_to_jsonl(file_type, source_path, output_path)
+        return
+
+    if file_type == "xlsx":
+        processed_data = excel_processor.process_file(source_path, source_path.name)
+    elif file_type in {"csv", "tsv"}:
+        with mapped_file(source_path) as content:
+            processed_data = csv_processor.process_file(content, source_path.name)
+    elif file_type == "json":
+        with mapped_file(source_path) as content:
+            processed_data = json_processor.process_file(content, source_path.name)
+    else:
+        raise ConversionError(f"Unsupported file type: {file_type}")
+
+    json_generator.generate_file(
+        processed_data, output_format, output_path, pretty_print
+    )
+
+
+def stream_delimited_to_jsonl(
+    file_type: str, source_path: Path, output_path: Path
+) -> None:
+    """
+    Convert a CSV/TSV file to JSONL chunk by chunk in constant memory.
+
+    Data lines are spooled to a temporary file first because the leading
+    metadata line carries the row count, which is only known at the end.
+
+    Args:
+        file_type: Source file type ('csv' or 'tsv')
+        source_path: Path of the uploaded file
+        output_path: Path of the output file to write
+    """
+    encoding, delimiter = csv_processor.detect_format(source_path)
+    headers: List[str] = []
+    row_count = 0
+
+    rows_path = output_path.with_name(f"{output_path.name}.rows")
+    try:
+        with open(rows_path, "wb", buffering=WRITE_BUFFER_SIZE) as rows_file:
+            for chunk in csv_processor.iter_chunks(
+                source_path, get_settings().CHUNK_SIZE, encoding, delimiter
+            ):
+                headers = chunk.columns.tolist()
+                records = csv_processor.frame_to_records(chunk)
+                rows_file.writelines(json_generator.iter_data_lines(records))
+                row_count += len(records)
+
+        metadata = {
+            "filename": source_path.name,
+            "file_type": file_type,
+            "data": [],
+            "headers": headers,
+            "row_count": row_count,
+            "column_count": len(headers),
+            "encoding": encoding,
+            "delimiter": delimiter,
+        }
+        with open(output_path, "wb") as f, open(rows_path, "rb") as rows_file:
+            f.writelines(json_generator.iter_json_lines(metadata))
+            shutil.copyfileobj(rows_file, f, get_settings().CHUNK_BYTES)
+    finally:
+        rows_path.unlink(missing_ok=True)
+
+
+async def process_conversion(job_id: str) -> None:
+    """Background task to process file conversion."""
+    try:
+        job = await get_job(job_id)
+        await update_job(job_id, status="processing")
+
+        logger.info(f"Processing conversion job: {job_id}")
+
+        output_format = job["output_format"]
+        output_filename = f"{job['file_id']}_converted.{output_format}"
+        output_path = get_settings().upload_path / output_filename
+
+        await run_in_process(
+            convert_to_file,
+            job["file_type"],
+            Path(job["file_path"]),
+            output_path,
+            output_format,
+            bool(int(job.get("pretty_print", 1))),
+        )
+
+        await register_converted_file(job["file_id"], output_path)
+        await finish_job(
+            job_id,
+            status="completed",
+            completed_at=time.time(),
+            output_file=output_filename,
+            message="Conversion completed successfully",
+        )
+
+        logger.info(f"Conversion job completed: {job_id}")
+
+    except Exception as e:
+        logger.error(f"Conversion job failed: {job_id} - {str(e)}")
+        await finish_job(
+            job_id,
+            status="failed",
+            error=str(e),
+            completed_at=time.time(),
+        )
@@ -21,6 +21,7 @@
         fileId: null,
         jobId: null,
         pollTimer: null,
+        eventSource: null,
     };
 
     function setStatus(target, message, type) {
@@ -47,6 +48,10 @@
             clearInterval(state.pollTimer);
             state.pollTimer = null;
         }
+        if (state.eventSource) {
+            state.eventSource.close();
+            state.eventSource = null;
+        }
     }
 
     async function handleUpload(event) {
@@ -154,7 +159,7 @@
             const data = await response.json();
             state.jobId = data.job_id;
             setStatus(conversionOutput, data.message || 'Conversion job started.', 'success');
-            state.pollTimer = setInterval(checkJobStatus, 2000);
+            watchJobStatus();
         } catch (error) {
             console.error(error);
             setStatus(conversionOutput, error.message || 'Conversion failed to start.', 'error');
@@ -162,6 +167,45 @@
         }
     }
 
+    function watchJobStatus() {
+        if (!window.EventSource) {
+            state.pollTimer = setInterval(checkJobStatus, 2000);
+            return;
+        }
+
+        const source = new EventSource(`/api/v1/process/status/${state.jobId}/stream`);
+        state.eventSource = source;
+        source.onmessage = function (event) {
+            applyJobStatus(JSON.parse(event.data));
+        };
+        source.onerror = function () {
+            // Fall back to polling if the stream drops before the job finishes
+            if (state.eventSource === source) {
+                stopPolling();
+                state.pollTimer = setInterval(checkJobStatus, 2000);
+            }
+        };
+    }
+
+    function applyJobStatus(data) {
+        if (data.status === 'completed') {
+            setStatus(conversionOutput, data.message || 'Conversion completed successfully.', 'success');
+            toggleSection(downloadSection, true);
+            if (downloadLink && state.fileId) {
+                downloadLink.href = `/api/v1/download/${state.fileId}`;
+            }
+            stopPolling();
+        } else if (data.status === 'failed') {
+            const message = data.error || 'Conversion job failed.';
+            setStatus(conversionOutput, message, 'error');
+            toggleSection(downloadSection, false);
+            stopPolling();
+        } else {
+            const statusMessage = data.message || `Job status: ${data.status}`;
+            setStatus(conversionOutput, statusMessage, '');
+        }
+    }
+
     async function checkJobStatus() {
         if (!state.jobId) {
             stopPolling();
@@ -176,23 +220,7 @@
                 throw new Error(message);
             }
 
-            const data = await response.json();
-            if (data.status === 'completed') {
-                setStatus(conversionOutput, data.message || 'Conversion completed successfully.', 'success');
-                toggleSection(downloadSection, true);
-                if (downloadLink && state.fileId) {
-                    downloadLink.href = `/api/v1/download/${state.fileId}`;
-                }
-                stopPolling();
-            } else if (data.status === 'failed') {
-                const message = data.error || 'Conversion job failed.';
-                setStatus(conversionOutput, message, 'error');
-                toggleSection(downloadSection, false);
-                stopPolling();
-            } else {
-                const statusMessage = data.message || `Job status: ${data.status}`;
-                setStatus(conversionOutput, statusMessage, '');
-            }
+            applyJobStatus(await response.json());
         } catch (error) {
             console.error(error);
             setStatus(conversionOutput, error.message || 'Unable to get job status.', 'error');